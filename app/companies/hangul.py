@@ -0,0 +1,44 @@
+from typing import Optional
+
+# 한글 음절 범위 (가 ~ 힣)
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+# 초성 하나에 해당하는 음절 수 (중성 21 x 종성 28)
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+# 초성 19자 (호환 자모 - 키보드로 입력되는 ㄱ, ㄲ, ...)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 겹받침 자모 -> 초성 두 자 (초성에는 없으므로 "ㄳ" 입력은 "ㄱㅅ"으로 검색)
+DOUBLE_CONSONANTS = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+# 검색어로 입력 가능한 자음 (겹받침 자모 포함)
+CONSONANTS = set(CHOSUNG) | set(DOUBLE_CONSONANTS)
+
+
+def extract_chosung(text: Optional[str]) -> Optional[str]:
+    """
+    초성 검색용 문자열 ("우리상사 A" -> "ㅇㄹㅅㅅa")
+
+    한글 음절은 초성으로, 겹받침 자모는 초성 두 자로 바꾸고, 공백은 빼고, 나머지 문자는 소문자로 그대로 둡니다.
+    """
+    if text is None:
+        return None
+
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            chars.append(CHOSUNG[(code - HANGUL_START) // SYLLABLES_PER_CHOSUNG])
+        elif char in DOUBLE_CONSONANTS:
+            chars.append(DOUBLE_CONSONANTS[char])
+        elif not char.isspace():
+            chars.append(char.lower())
+    return "".join(chars)
+
+
+def is_chosung_query(query: str) -> bool:
+    """자음으로만 된 검색어인지 (공백 제외, 예: "ㅇㄹㅅㅅ")"""
+    chars = [char for char in query if not char.isspace()]
+    return bool(chars) and all(char in CONSONANTS for char in chars)
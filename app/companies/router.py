@@ -5,9 +5,13 @@ from typing import List, Optional
 from app.database import get_db
 from app.schemas import CompanyCreate, CompanyUpdate, CompanyResponse, CompanyBulkUploadResult
 from app.companies import service
+from app.companies.upload import UPLOAD_EXTENSIONS, is_upload_file, open_upload_rows, upload_size
 from app.auth.router import get_current_user
+from config import settings
 import openpyxl
+from openpyxl.utils.exceptions import InvalidFileException
 from io import BytesIO
+from zipfile import BadZipFile
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
 
@@ -20,7 +24,7 @@ def test_endpoint():
 
 @router.get("", response_model=List[CompanyResponse])
 def get_companies(
-    search: Optional[str] = Query(None, description="검색어 (이름 또는 아이디)"),
+    search: Optional[str] = Query(None, description="검색어 (이름, 아이디 또는 초성 - 관련도 순)"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     db: Session = Depends(get_db)
@@ -64,6 +68,13 @@ def create_company(
     current_user = Depends(get_current_user)
 ):
     """발주사 등록"""
+    # 발주사 아이디 중복 체크
+    if service.get_company_by_company_id(db, company_data.company_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 등록된 발주사 아이디입니다"
+        )
+
     company = service.create_company(db, company_data)
     return company
 
@@ -76,6 +87,15 @@ def update_company(
     current_user = Depends(get_current_user)
 ):
     """발주사 수정"""
+    # 발주사 아이디를 바꾸는 경우 중복 체크
+    if company_data.company_id:
+        existing = service.get_company_by_company_id(db, company_data.company_id)
+        if existing and existing.id != company_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 등록된 발주사 아이디입니다"
+            )
+
     company = service.update_company(db, company_id, company_data)
     if not company:
         raise HTTPException(
@@ -147,86 +167,71 @@ def download_template(current_user = Depends(get_current_user)):
 
 
 @router.post("/bulk-upload", response_model=CompanyBulkUploadResult)
-async def bulk_upload_companies(
+def bulk_upload_companies(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
-    # current_user = Depends(get_current_user)  # 임시로 비활성화
+    upsert: bool = Query(False, description="이미 등록된 발주사 아이디는 오류 대신 정보 수정"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
 ):
-    """엑셀 파일로 발주사 대량 등록"""
+    """
+    엑셀 또는 CSV/TSV 파일로 발주사 대량 등록
+
+    업로드 파일은 메모리로 읽지 않고 임시 파일에서 한 행씩 읽어 검사/저장합니다 (엑셀은 read_only 모드).
+    upsert=true면 발주사 아이디가 같은 기존 발주사의 발주사명/전화번호/메모를 수정합니다.
+    """
 
     # 파일 확장자 체크
-    if not file.filename.endswith(('.xlsx', '.xls')):
+    if not is_upload_file(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="엑셀 파일만 업로드 가능합니다 (.xlsx, .xls)"
+            detail=f"엑셀 또는 CSV 파일만 업로드 가능합니다 ({', '.join(UPLOAD_EXTENSIONS)})"
         )
 
-    # 파일 크기 체크 (5MB)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
+    # 파일 크기 체크
+    max_bytes = settings.COMPANY_UPLOAD_MAX_BYTES
+    if upload_size(file) > max_bytes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="파일 크기는 5MB를 초과할 수 없습니다"
+            detail=f"파일 크기는 {max_bytes // (1024 * 1024)}MB를 초과할 수 없습니다"
         )
 
     try:
-        print(f"[DEBUG] 엑셀 파일 처리 시작: {file.filename}")
-        
-        # 엑셀 파일 읽기
-        wb = openpyxl.load_workbook(BytesIO(contents))
-        ws = wb.active
-
-        # 데이터 추출
-        companies_data = []
-        max_rows = 501  # 헤더 1행 + 데이터 500행
-
-        for idx, row in enumerate(ws.iter_rows(min_row=2, max_row=max_rows, values_only=True)):
-            # 빈 행 스킵
-            if not any(row):
-                continue
-
-            # 최대 500개 제한
-            if len(companies_data) >= 500:
-                break
-
-            name = str(row[0]).strip() if row[0] else ""
-            phone = str(row[1]).strip() if row[1] else ""
-            company_id = str(row[2]).strip() if row[2] else ""
-            memo = str(row[3]).strip() if row[3] and row[3] != "None" else ""
-
-            companies_data.append({
-                "name": name,
-                "phone": phone,
-                "company_id": company_id,
-                "memo": memo
-            })
-
-        print(f"[DEBUG] 엑셀에서 추출된 데이터: {len(companies_data)}개")
-
-        if not companies_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="엑셀 파일에 등록할 데이터가 없습니다"
-            )
+        print(f"[DEBUG] 업로드 파일 처리 시작: {file.filename}")
+
+        # 파일 열기 (행은 등록 처리 중에 하나씩 읽음)
+        rows = open_upload_rows(file.file, file.filename)
 
         # 대량 등록 처리
         print(f"[DEBUG] 대량 등록 서비스 호출 시작")
-        success_count, errors = service.create_companies_bulk(db, companies_data)
+        success_count, errors = service.create_companies_bulk(db, rows, upsert=upsert)
         print(f"[DEBUG] 대량 등록 서비스 완료: 성공={success_count}, 에러={len(errors)}")
 
+        if not success_count and not errors:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="파일에 등록할 데이터가 없습니다"
+            )
+
         return CompanyBulkUploadResult(
             success_count=success_count,
             error_count=len(errors),
             errors=errors
         )
 
-    except openpyxl.utils.exceptions.InvalidFileException:
+    except HTTPException:
+        raise
+    except (InvalidFileException, BadZipFile):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="유효하지 않은 엑셀 파일입니다"
         )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,164 @@
+from sqlalchemy import case, func, or_, select, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query, Session
+from app.models import Company
+from app.companies.hangul import extract_chosung, is_chosung_query
+
+# SQLite FTS5 trigram 인덱스 (3글자 이상 검색어만 사용 가능)
+FTS_TABLE = "companies_fts"
+FTS_MIN_LENGTH = 3
+# 관련도 정렬 후보 수 (가져올 건수의 배수 - 일치하는 발주사 전체를 정렬하지 않도록 제한)
+SEARCH_CANDIDATE_FACTOR = 10
+# 앞부분 일치 범위 조회 상한 (어떤 문자보다 큰 코드 포인트)
+PREFIX_UPPER_BOUND = "\U0010ffff"
+# 초성 채우기 시 한 번에 처리하는 행 수
+BACKFILL_CHUNK_SIZE = 1000
+
+# SQLite에서 FTS 인덱스를 쓸 수 있는지 (ensure_company_search_index에서 설정)
+_fts_enabled = False
+
+_FTS_STATEMENTS = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        name, company_id, name_chosung,
+        content='companies', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS companies_fts_ai AFTER INSERT ON companies BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, company_id, name_chosung)
+        VALUES (new.id, new.name, new.company_id, new.name_chosung);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS companies_fts_ad AFTER DELETE ON companies BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, company_id, name_chosung)
+        VALUES ('delete', old.id, old.name, old.company_id, old.name_chosung);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS companies_fts_au AFTER UPDATE ON companies BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, company_id, name_chosung)
+        VALUES ('delete', old.id, old.name, old.company_id, old.name_chosung);
+        INSERT INTO {FTS_TABLE}(rowid, name, company_id, name_chosung)
+        VALUES (new.id, new.name, new.company_id, new.name_chosung);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def search_companies(db: Session, query: Query, search: str, limit: int) -> Query:
+    """
+    발주사 검색 조건과 관련도 정렬 추가
+
+    - 자음만 입력하면 발주사명 초성 검색 ("ㅇㄹㅅㅅ" -> 우리상사)
+    - 그 외에는 발주사명/아이디 부분 일치 (SQLite는 3글자 이상이면 FTS5 trigram 인덱스,
+      PostgreSQL은 pg_trgm GIN 인덱스가 있으면 ILIKE에 사용됨 - migrations/add_company_search.sql)
+    - 정확히 일치 > 앞부분 일치 > 부분 일치 순, 같으면 짧은 이름 순
+
+    일치하는 발주사 전체를 정렬하지 않고, B-tree 인덱스 범위 조회로 찾은 앞부분 일치 후보와
+    부분 일치 후보를 각각 limit * SEARCH_CANDIDATE_FACTOR건까지만 모아 그 안에서 정렬합니다.
+    ("삼성"처럼 짧은 검색어는 일치하는 발주사가 많아 전체 정렬이 느림)
+
+    Args:
+        limit: 호출하는 쪽에서 가져올 건수 (offset 포함)
+    """
+    term = search.strip()
+    if not term:
+        return query
+
+    if is_chosung_query(term):
+        term = extract_chosung(term)
+        columns = [Company.name_chosung]
+        relevance = case(
+            (Company.name_chosung == term, 0),
+            (_like(db, Company.name_chosung, _escape_like(term) + "%"), 1),
+            else_=2
+        )
+    else:
+        columns = [Company.name, Company.company_id]
+        relevance = case(
+            (or_(_like(db, Company.name, _escape_like(term)), _like(db, Company.company_id, _escape_like(term))), 0),
+            (_like(db, Company.name, _escape_like(term) + "%"), 1),
+            (_like(db, Company.company_id, _escape_like(term) + "%"), 2),
+            else_=3
+        )
+
+    candidate_limit = max(1, limit) * SEARCH_CANDIDATE_FACTOR
+    candidates = [_substring_candidates(db, columns, term, candidate_limit)]
+    # 범위 조건은 인덱스 조회용, LIKE는 정렬 규칙(collation)에 따라 범위에 섞인 앞부분 불일치 행 제외용
+    candidates += [
+        select(Company.id).where(
+            column >= term,
+            column < term + PREFIX_UPPER_BOUND,
+            _like(db, column, _escape_like(term) + "%")
+        ).limit(candidate_limit)
+        for column in columns
+    ]
+
+    return query.filter(
+        or_(*(Company.id.in_(candidate) for candidate in candidates))
+    ).order_by(relevance, func.length(Company.name), Company.name, Company.id)
+
+
+def ensure_company_search_index(db: Session):
+    """SQLite FTS5 trigram 검색 테이블과 동기화 트리거 생성 (없을 때만, PostgreSQL은 마이그레이션 사용)"""
+    global _fts_enabled
+    if db.get_bind().dialect.name != "sqlite":
+        return
+
+    exists = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).first()
+    if not exists:
+        try:
+            for statement in _FTS_STATEMENTS:
+                db.execute(text(statement))
+            db.commit()
+        except OperationalError as e:
+            # trigram 토크나이저는 SQLite 3.34 이상
+            db.rollback()
+            print(f"[WARN] 발주사 검색 인덱스 생성 실패 (LIKE 검색 사용): {e}")
+            return
+    _fts_enabled = True
+
+
+def backfill_name_chosung(db: Session) -> int:
+    """초성이 비어 있는 발주사의 name_chosung 채우기 (컬럼 추가 전 등록된 발주사)"""
+    count = 0
+    while True:
+        rows = db.execute(
+            select(Company.id, Company.name).where(Company.name_chosung.is_(None)).limit(BACKFILL_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return count
+        db.execute(update(Company), [{"id": id, "name_chosung": extract_chosung(name)} for id, name in rows])
+        db.commit()
+        count += len(rows)
+
+
+def _substring_candidates(db: Session, columns, term: str, limit: int):
+    """
+    columns 중 하나에 term이 들어 있는 발주사 ID를 limit건까지 조회
+
+    SQLite는 검색어가 3글자 이상이면 FTS 인덱스, 아니면 LIKE
+    """
+    if _fts_enabled and len(term) >= FTS_MIN_LENGTH and db.get_bind().dialect.name == "sqlite":
+        # 검색어 전체를 한 구절로 검색 (큰따옴표는 두 번 써서 이스케이프)
+        phrase = '"' + term.replace('"', '""') + '"'
+        column_filter = "{" + " ".join(column.key for column in columns) + "}"
+        match = text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=f"{column_filter} : {phrase}")
+        return select(text("rowid")).select_from(text(FTS_TABLE)).where(match).limit(limit)
+
+    pattern = "%" + _escape_like(term) + "%"
+    return select(Company.id).where(or_(*(_like(db, column, pattern) for column in columns))).limit(limit)
+
+
+def _like(db: Session, column, pattern: str):
+    """
+    대소문자 구분 없는 LIKE
+
+    SQLite LIKE는 원래 영문 대소문자를 구분하지 않으므로 lower()를 씌우는 ilike 대신 LIKE를 그대로 사용
+    (행마다 lower() 호출이 없어 전체 검색이 2배 이상 빠름), PostgreSQL은 ILIKE (pg_trgm 인덱스 사용 가능)
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return column.like(pattern, escape="\\")
+    return column.ilike(pattern, escape="\\")
+
+
+def _escape_like(value: str) -> str:
+    """LIKE 특수문자(%, _) 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
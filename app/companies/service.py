@@ -1,22 +1,27 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models import Company
+from app.companies.hangul import extract_chosung
+from app.companies.search import search_companies
 from app.schemas import CompanyCreate, CompanyUpdate, BulkUploadError
-from typing import List, Optional, Tuple
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import re
 
+# IN (...) 조회 1회당 최대 파라미터 수 (SQLite 변수 개수 제한 대비)
+IN_QUERY_CHUNK_SIZE = 500
+# 대량 등록 시 한 번에 INSERT하는 행 수
+BULK_INSERT_CHUNK_SIZE = 1000
+
 
 def get_companies(db: Session, search: Optional[str] = None, skip: int = 0, limit: int = 100) -> List[Company]:
-    """발주사 목록 조회 (검색 포함)"""
+    """발주사 목록 조회 (검색 포함 - 검색하면 관련도 순)"""
     query = db.query(Company)
 
     if search:
-        query = query.filter(
-            or_(
-                Company.name.ilike(f"%{search}%"),
-                Company.company_id.ilike(f"%{search}%")
-            )
-        )
+        query = search_companies(db, query, search, limit=skip + limit)
 
     return query.offset(skip).limit(limit).all()
 
@@ -26,6 +31,22 @@ def get_company_by_id(db: Session, company_id: int) -> Optional[Company]:
     return db.query(Company).filter(Company.id == company_id).first()
 
 
+def get_company_by_company_id(db: Session, company_id: str) -> Optional[Company]:
+    """발주사 아이디로 발주사 조회"""
+    return db.query(Company).filter(Company.company_id == company_id).first()
+
+
+def get_companies_by_ids(db: Session, company_ids: Iterable[int]) -> Dict[int, Company]:
+    """ID 목록으로 발주사 일괄 조회 (IN 조회, {id: 발주사})"""
+    ids = list(set(company_ids))
+    companies = {}
+    for start in range(0, len(ids), IN_QUERY_CHUNK_SIZE):
+        chunk = ids[start:start + IN_QUERY_CHUNK_SIZE]
+        for company in db.query(Company).filter(Company.id.in_(chunk)).all():
+            companies[company.id] = company
+    return companies
+
+
 def create_company(db: Session, company_data: CompanyCreate) -> Company:
     """발주사 생성"""
     db_company = Company(
@@ -80,162 +101,184 @@ def validate_phone_number(phone: str) -> bool:
     return bool(re.match(pattern, phone_clean))
 
 
-def create_companies_bulk(db: Session, companies_data: List[dict]) -> Tuple[int, List[BulkUploadError]]:
+def create_companies_bulk(
+    db: Session,
+    companies_data: Iterable[dict],
+    upsert: bool = False
+) -> Tuple[int, List[BulkUploadError]]:
     """
     발주사 대량 등록
 
+    BULK_INSERT_CHUNK_SIZE행씩 나눠 검사/INSERT하고 마지막에 한 번 커밋합니다.
+    중복 체크는 청크에 나온 발주사명/전화번호/아이디만 IN 조회로 확인하므로 기존 발주사 수와 무관합니다.
+    companies_data가 제너레이터여도 전체를 메모리에 올리지 않습니다.
+
     Args:
         db: 데이터베이스 세션
-        companies_data: 발주사 데이터 리스트 [{"name": "", "phone": "", "company_id": "", "memo": ""}, ...]
+        companies_data: 발주사 데이터 [{"row": 엑셀 행 번호(선택), "name": "", "phone": "", "company_id": "", "memo": ""}, ...]
+        upsert: True면 이미 등록된 발주사 아이디는 오류 대신 발주사명/전화번호/메모를 수정
+                (청크마다 INSERT ... ON CONFLICT 한 번, 파일의 메모가 비어 있으면 기존 메모 유지)
 
     Returns:
         (성공 건수, 에러 리스트)
+
+    Raises:
+        ValueError: companies_data를 읽는 중 발생한 오류 (행 수 초과 등) - 저장한 행은 모두 롤백
     """
     success_count = 0
     errors = []
     
-    print(f"[DEBUG] 대량 업로드 시작: {len(companies_data)}개 데이터 처리")
+    print(f"[DEBUG] 대량 업로드 시작")
 
     try:
-        # 기존 발주사명, 전화번호 목록 조회 (중복 체크용)
-        existing_names = {c.name for c in db.query(Company.name).all()}
-        existing_phones = {c.phone for c in db.query(Company.phone).all()}
-        existing_company_ids = {c.company_id for c in db.query(Company.company_id).all()}
-        
-        print(f"[DEBUG] 기존 데이터 수: 이름={len(existing_names)}, 전화번호={len(existing_phones)}, 아이디={len(existing_company_ids)}")
-
-        # 유효한 데이터만 저장할 리스트
-        valid_companies = []
-
-        for idx, data in enumerate(companies_data):
-            row_num = idx + 2  # 엑셀 행 번호 (헤더 1행 + 1부터 시작)
-
-            try:
-                # 필수 항목 체크
-                name = data.get("name", "").strip()
-                phone = data.get("phone", "").strip()
-                company_id = data.get("company_id", "").strip()
-                memo = data.get("memo", "").strip() if data.get("memo") else None
-
-                if not name:
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error="발주사명은 필수입니다"
-                    ))
-                    continue
-
-                if not phone:
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error="전화번호는 필수입니다"
-                    ))
-                    continue
-
-                if not company_id:
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error="발주사 아이디는 필수입니다"
-                    ))
-                    continue
-
-                # 전화번호 형식 검사
-                if not validate_phone_number(phone):
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error="전화번호 형식이 올바르지 않습니다 (예: 01012345678)"
-                    ))
-                    continue
-
-                # 중복 체크
-                if name in existing_names:
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error=f"이미 등록된 발주사명입니다: {name}"
-                    ))
-                    continue
-
-                if phone in existing_phones:
-                    errors.append(BulkUploadError(
-                        row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error=f"이미 등록된 전화번호입니다: {phone}"
-                    ))
-                    continue
+        # 중복 체크용 {발주사명/전화번호/아이디: 사용 중인 발주사 아이디} (업로드에 나온 값 중 이미 등록된 값 + 이번 업로드에서 등록할 값)
+        existing_names = {}
+        existing_phones = {}
+        existing_company_ids = {}
+        # 이번 업로드에서 등록할 발주사 아이디 (upsert 모드에서 같은 아이디가 파일에 두 번 나오는 경우 확인)
+        uploaded_company_ids = set()
+
+        for chunk in _iter_chunks(enumerate(companies_data), BULK_INSERT_CHUNK_SIZE):
+            # 이번 청크에 나온 값만 DB에서 조회 (테이블 전체가 아니라 업로드 건수에 비례)
+            existing_names.update(_existing_owners(db, Company.name, (_upload_value(data, "name") for _, data in chunk)))
+            existing_phones.update(_existing_owners(db, Company.phone, (_upload_value(data, "phone") for _, data in chunk)))
+            existing_company_ids.update(
+                _existing_owners(db, Company.company_id, (_upload_value(data, "company_id") for _, data in chunk))
+            )
 
-                if company_id in existing_company_ids:
+            # 저장할 유효한 데이터 (청크마다 저장)
+            valid_companies = []
+
+            for idx, data in chunk:
+                row_num = data.get("row", idx + 2)  # 엑셀 행 번호 (헤더 1행 + 1부터 시작)
+
+                try:
+                    # 필수 항목 체크
+                    name = data.get("name", "").strip()
+                    phone = data.get("phone", "").strip()
+                    company_id = data.get("company_id", "").strip()
+                    memo = data.get("memo", "").strip() if data.get("memo") else None
+
+                    if not name:
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error="발주사명은 필수입니다"
+                        ))
+                        continue
+
+                    if not phone:
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error="전화번호는 필수입니다"
+                        ))
+                        continue
+
+                    if not company_id:
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error="발주사 아이디는 필수입니다"
+                        ))
+                        continue
+
+                    # 전화번호 형식 검사
+                    if not validate_phone_number(phone):
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error="전화번호 형식이 올바르지 않습니다 (예: 01012345678)"
+                        ))
+                        continue
+
+                    # 중복 체크 (upsert 모드에서는 같은 발주사 아이디가 쓰던 값이면 중복 아님)
+                    if _is_taken(existing_names, name, company_id, upsert):
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error=f"이미 등록된 발주사명입니다: {name}"
+                        ))
+                        continue
+
+                    if _is_taken(existing_phones, phone, company_id, upsert):
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error=f"이미 등록된 전화번호입니다: {phone}"
+                        ))
+                        continue
+
+                    if upsert and company_id in uploaded_company_ids:
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error=f"파일에 같은 발주사 아이디가 여러 번 있습니다: {company_id}"
+                        ))
+                        continue
+
+                    if not upsert and company_id in existing_company_ids:
+                        errors.append(BulkUploadError(
+                            row=row_num,
+                            name=name,
+                            phone=phone,
+                            company_id=company_id,
+                            error=f"이미 등록된 발주사 아이디입니다: {company_id}"
+                        ))
+                        continue
+
+                    # 유효한 데이터로 추가
+                    valid_companies.append({
+                        "name": name,
+                        "name_chosung": extract_chosung(name),
+                        "phone": phone,
+                        "company_id": company_id,
+                        "memo": memo
+                    })
+
+                    # 중복 방지를 위해 추가
+                    existing_names[name] = company_id
+                    existing_phones[phone] = company_id
+                    existing_company_ids[company_id] = company_id
+                    uploaded_company_ids.add(company_id)
+
+                    success_count += 1
+
+                except Exception as e:
+                    print(f"[ERROR] 행 {row_num} 처리 중 오류: {str(e)}")
                     errors.append(BulkUploadError(
                         row=row_num,
-                        name=name,
-                        phone=phone,
-                        company_id=company_id,
-                        error=f"이미 등록된 발주사 아이디입니다: {company_id}"
+                        name=data.get("name", ""),
+                        phone=data.get("phone", ""),
+                        company_id=data.get("company_id", ""),
+                        error=f"처리 중 오류 발생: {str(e)}"
                     ))
-                    continue
-
-                # 유효한 데이터로 추가
-                valid_companies.append({
-                    "name": name,
-                    "phone": phone,
-                    "company_id": company_id,
-                    "memo": memo
-                })
 
-                # 중복 방지를 위해 추가
-                existing_names.add(name)
-                existing_phones.add(phone)
-                existing_company_ids.add(company_id)
+            if valid_companies:
+                _save_companies(db, valid_companies, upsert)
 
-                success_count += 1
+        print(f"[DEBUG] 유효한 데이터: {success_count}개, 에러: {len(errors)}개")
 
-            except Exception as e:
-                print(f"[ERROR] 행 {row_num} 처리 중 오류: {str(e)}")
-                errors.append(BulkUploadError(
-                    row=row_num,
-                    name=data.get("name", ""),
-                    phone=data.get("phone", ""),
-                    company_id=data.get("company_id", ""),
-                    error=f"처리 중 오류 발생: {str(e)}"
-                ))
-
-        print(f"[DEBUG] 유효한 데이터: {len(valid_companies)}개, 에러: {len(errors)}개")
-
-        # 유효한 데이터가 있으면 일괄 저장
-        if valid_companies:
+        # 저장한 데이터 한 번에 커밋
+        if success_count:
             try:
-                # 배치 삽입을 위한 객체 생성
-                companies_to_add = []
-                for data in valid_companies:
-                    company = Company(
-                        name=data["name"],
-                        phone=data["phone"],
-                        company_id=data["company_id"],
-                        memo=data["memo"]
-                    )
-                    companies_to_add.append(company)
-
-                # 모든 객체를 세션에 추가
-                db.add_all(companies_to_add)
-                
                 # 커밋 실행
                 db.commit()
-                print(f"[DEBUG] 데이터베이스 커밋 성공: {len(companies_to_add)}개 저장")
+                print(f"[DEBUG] 데이터베이스 커밋 성공: {success_count}개 저장")
                 
             except Exception as e:
                 print(f"[ERROR] 데이터베이스 저장 실패: {str(e)}")
@@ -250,6 +293,9 @@ def create_companies_bulk(db: Session, companies_data: List[dict]) -> Tuple[int,
                 )]
                 success_count = 0
 
+    except ValueError:
+        db.rollback()
+        raise
     except Exception as e:
         print(f"[ERROR] 대량 업로드 전체 실패: {str(e)}")
         db.rollback()
@@ -263,4 +309,59 @@ def create_companies_bulk(db: Session, companies_data: List[dict]) -> Tuple[int,
         success_count = 0
 
     print(f"[DEBUG] 최종 결과: 성공={success_count}, 에러={len(errors)}")
-    return success_count, errors
\ No newline at end of file
+    return success_count, errors
+
+
+def _save_companies(db: Session, companies: List[dict], upsert: bool = False):
+    """발주사 여러 건을 INSERT(upsert면 INSERT ... ON CONFLICT) 한 번으로 저장 (커밋은 호출한 쪽에서)"""
+    db.execute(_upsert_statement(db) if upsert else insert(Company), companies)
+
+
+def _upsert_statement(db: Session):
+    """발주사 아이디가 같으면 수정하는 INSERT (PostgreSQL/SQLite 모두 ON CONFLICT 지원)"""
+    dialect_insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    table = Company.__table__
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.company_id],
+        set_={
+            "name": stmt.excluded.name,
+            "name_chosung": stmt.excluded.name_chosung,
+            "phone": stmt.excluded.phone,
+            "memo": func.coalesce(stmt.excluded.memo, table.c.memo),
+            # ON CONFLICT 수정에는 onupdate가 적용되지 않음
+            "updated_at": func.now()
+        }
+    )
+
+
+def _existing_owners(db: Session, column, values: Iterable[str]) -> Dict[str, str]:
+    """values 중 이미 등록된 값 {값: 그 값을 쓰는 발주사 아이디} (IN 조회를 IN_QUERY_CHUNK_SIZE개씩 나눠 실행)"""
+    candidates = [value for value in set(values) if value]
+    owners = {}
+    for start in range(0, len(candidates), IN_QUERY_CHUNK_SIZE):
+        chunk = candidates[start:start + IN_QUERY_CHUNK_SIZE]
+        owners.update(db.query(column, Company.company_id).filter(column.in_(chunk)).all())
+    return owners
+
+
+def _is_taken(owners: Dict[str, str], value: str, company_id: str, upsert: bool) -> bool:
+    """다른 발주사가 이미 쓰는 값인지 (upsert가 아니면 등록된 값이면 모두 중복)"""
+    if value not in owners:
+        return False
+    return not upsert or owners[value] != company_id
+
+
+def _upload_value(data: dict, key: str) -> str:
+    """업로드 행의 값 (앞뒤 공백 제거)"""
+    return str(data.get(key) or "").strip()
+
+
+def _iter_chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    """iterable을 size개씩 나눈 리스트 생성"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
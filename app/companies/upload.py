@@ -0,0 +1,128 @@
+import codecs
+import csv
+import io
+import os
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+import openpyxl
+from fastapi import UploadFile
+from config import settings
+
+# 업로드 컬럼 순서 (발주사명, 전화번호, 발주사아이디, 메모)
+UPLOAD_COLUMNS = ["name", "phone", "company_id", "memo"]
+# 업로드 가능한 파일 확장자
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
+CSV_EXTENSIONS = (".csv", ".tsv")
+UPLOAD_EXTENSIONS = EXCEL_EXTENSIONS + CSV_EXTENSIONS
+
+# CSV 인코딩 확인 시 한 번에 읽는 크기
+ENCODING_CHECK_CHUNK_SIZE = 64 * 1024
+# UTF-8이 아닐 때 사용하는 인코딩 (EUC-KR을 포함하는 CP949)
+FALLBACK_ENCODING = "cp949"
+
+
+def upload_size(file: UploadFile) -> int:
+    """업로드 파일 크기 (Starlette가 받은 내용을 임시 파일에 두므로 메모리로 읽지 않고 확인)"""
+    if file.size is not None:
+        return file.size
+    position = file.file.tell()
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(position)
+    return size
+
+
+def is_upload_file(filename: str) -> bool:
+    """업로드 가능한 확장자인지 확인"""
+    return filename.lower().endswith(UPLOAD_EXTENSIONS)
+
+
+def open_upload_rows(fileobj: BinaryIO, filename: str, max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """확장자에 따라 엑셀 또는 CSV/TSV 행 제너레이터 반환"""
+    if filename.lower().endswith(CSV_EXTENSIONS):
+        return open_csv_rows(fileobj, filename, max_rows)
+    return open_excel_rows(fileobj, max_rows)
+
+
+def open_excel_rows(fileobj: BinaryIO, max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    엑셀 첫 시트의 발주사 행을 한 행씩 읽는 제너레이터 반환
+
+    read_only 모드로 열어 시트 전체를 메모리에 올리지 않습니다.
+    파일 형식 오류는 여기서 바로 발생하고, 행 수가 max_rows를 넘으면 읽는 도중 ValueError가 발생합니다.
+    """
+    fileobj.seek(0)
+    wb = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+
+    def rows():
+        try:
+            yield from enumerate(wb.active.iter_rows(min_row=2, values_only=True), 2)
+        finally:
+            wb.close()
+
+    return _iter_rows(rows(), max_rows)
+
+
+def open_csv_rows(fileobj: BinaryIO, filename: str = "", max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    CSV/TSV 발주사 행을 한 행씩 읽는 제너레이터 반환 (첫 행은 헤더, 컬럼 순서는 엑셀 템플릿과 같음)
+
+    인코딩은 UTF-8(BOM 포함)인지 파일을 나눠 읽으며 확인하고, 아니면 CP949(EUC-KR)로 읽습니다.
+    구분자는 .tsv면 탭, .csv면 헤더에 쉼표 없이 탭만 있을 때 탭으로 판단합니다.
+    """
+    text = io.TextIOWrapper(fileobj, encoding=detect_encoding(fileobj), newline="")
+
+    def rows():
+        try:
+            header = text.readline()
+            delimiter = "\t" if filename.lower().endswith(".tsv") or ("\t" in header and "," not in header) else ","
+            # 헤더가 1행이므로 데이터는 2행부터
+            yield from enumerate(csv.reader(text, delimiter=delimiter), 2)
+        except UnicodeDecodeError:
+            raise ValueError("파일 인코딩을 확인할 수 없습니다 (UTF-8 또는 CP949로 저장해 주세요)")
+        finally:
+            # 업로드 파일은 Starlette가 닫으므로 래퍼만 분리
+            text.detach()
+
+    return _iter_rows(rows(), max_rows)
+
+
+def detect_encoding(fileobj: BinaryIO) -> str:
+    """CSV 인코딩 판단 (UTF-8 BOM이면 utf-8-sig, 전체가 UTF-8로 읽히면 utf-8, 아니면 CP949) 후 처음으로 되돌림"""
+    fileobj.seek(0)
+    if fileobj.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+        fileobj.seek(0)
+        return "utf-8-sig"
+
+    fileobj.seek(0)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        while True:
+            chunk = fileobj.read(ENCODING_CHECK_CHUNK_SIZE)
+            decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                return "utf-8"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    finally:
+        fileobj.seek(0)
+
+
+def _iter_rows(rows: Iterable[Tuple[int, Sequence[Any]]], max_rows: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """(행 번호, 값) 목록에서 빈 행을 건너뛰고 {"row": 행 번호, "name", "phone", "company_id", "memo"} 생성"""
+    max_rows = max_rows if max_rows is not None else settings.COMPANY_UPLOAD_MAX_ROWS
+    count = 0
+    for row_num, row in rows:
+        # 빈 행 스킵
+        if not any(row):
+            continue
+
+        count += 1
+        if count > max_rows:
+            raise ValueError(f"한 번에 최대 {max_rows}행까지 등록할 수 있습니다")
+
+        # 뒤쪽 빈 셀이 빠진 짧은 행이 올 수 있음
+        values = list(row[:len(UPLOAD_COLUMNS)]) + [None] * (len(UPLOAD_COLUMNS) - len(row))
+        data = {"row": row_num}
+        for key, value in zip(UPLOAD_COLUMNS, values):
+            data[key] = str(value).strip() if value is not None else ""
+        yield data
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
@@ -44,6 +45,68 @@ def get_db():
 
 
 def init_db():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 (기존 SQLite DB는 새 컬럼/인덱스 추가)"""
     from app import models
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == "sqlite":
+        upgrade_sqlite_schema()
+
+
+def upgrade_sqlite_schema():
+    """
+    기존 로컬 SQLite DB를 모델에 맞게 변경 (여러 번 실행해도 안전)
+
+    create_all은 이미 있는 테이블을 바꾸지 않으므로, 없는 컬럼은 ALTER TABLE ADD COLUMN으로,
+    없는 인덱스는 CREATE INDEX로 추가합니다. NOT NULL 해제처럼 ALTER TABLE로 바꿀 수 없는 변경은
+    테이블을 새로 만들어 데이터를 복사합니다. PostgreSQL은 migrations/*.sql을 사용하세요.
+    """
+    existing_tables = set(inspect(engine).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        with engine.begin() as conn:
+            columns = {row.name: row for row in conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")')}
+            relaxed = [
+                column.name for column in table.columns
+                if column.name in columns and column.nullable and not column.primary_key and columns[column.name].notnull
+            ]
+            if relaxed:
+                _rebuild_sqlite_table(conn, table, columns)
+                print(f"[INFO] {table.name} 테이블 재생성 (NOT NULL 해제: {', '.join(relaxed)})")
+                continue
+
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+                print(f"[INFO] {table.name}.{column.name} 컬럼 추가")
+                if column.name == "name_chosung":
+                    print("[INFO] 기존 발주사의 초성을 채우려면 backfill_company_chosung.py를 실행하세요")
+
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except IntegrityError:
+                # 기존 데이터에 중복이 있으면 유니크 인덱스를 만들 수 없음 (중복 정리 후 재시작하면 생성됨)
+                columns_list = ", ".join(column.name for column in index.columns)
+                print(f"[WARN] {index.name} 인덱스 생성 실패 - {table.name}({columns_list})에 중복 값이 있습니다")
+
+
+def _rebuild_sqlite_table(conn, table, old_columns):
+    """SQLite 테이블을 모델 정의대로 다시 만들고 기존 데이터 복사 (인덱스 포함)"""
+    old_name = f"{table.name}_old"
+    for index in list(conn.exec_driver_sql(f'PRAGMA index_list("{table.name}")')):
+        if index.origin == "c":
+            conn.exec_driver_sql(f'DROP INDEX "{index.name}"')
+
+    # 다른 테이블의 외래 키가 이름을 바꾼 테이블을 가리키지 않도록
+    conn.exec_driver_sql("PRAGMA legacy_alter_table = ON")
+    conn.exec_driver_sql(f'ALTER TABLE "{table.name}" RENAME TO "{old_name}"')
+    conn.exec_driver_sql("PRAGMA legacy_alter_table = OFF")
+
+    table.create(bind=conn)
+    names = ", ".join(f'"{column.name}"' for column in table.columns if column.name in old_columns)
+    conn.exec_driver_sql(f'INSERT INTO "{table.name}" ({names}) SELECT {names} FROM "{old_name}"')
+    conn.exec_driver_sql(f'DROP TABLE "{old_name}"')
\ No newline at end of file
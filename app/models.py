@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, DateTime, CheckConstraint, Index, UniqueConstraint
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.database import Base
+from app.companies.hangul import extract_chosung
 
 
 class User(Base):
@@ -18,12 +20,29 @@ class Company(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
+    # 발주사명 초성 (초성 검색용, name을 바꾸면 자동으로 갱신 - 대량 등록은 직접 채움)
+    name_chosung = Column(String(100))
     phone = Column(String(20), nullable=False)
     company_id = Column(String(50), nullable=False)
     memo = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # 발주사 아이디는 외부 시스템 키 (대량 등록 upsert 기준)
+        Index("uq_companies_company_id", "company_id", unique=True),
+        # 대량 등록 중복 체크용
+        Index("ix_companies_name", "name"),
+        Index("ix_companies_phone", "phone"),
+        # 검색 자동완성 앞부분 일치 후보 조회용 (발주사명/아이디는 위 인덱스 사용)
+        Index("ix_companies_name_chosung", "name_chosung"),
+    )
+
+    @validates("name")
+    def _update_name_chosung(self, key, name):
+        self.name_chosung = extract_chosung(name)
+        return name
+
 
 class Template(Base):
     __tablename__ = "templates"
@@ -53,17 +72,33 @@ class Draft(Base):
     )
 
 
+class MessageBody(Base):
+    """발송 메시지 본문 (발주사명/캠페인명 치환 전 - 같은 본문을 발송 이력마다 반복 저장하지 않도록 공유)"""
+    __tablename__ = "message_bodies"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(String(64), unique=True, nullable=False)  # 템플릿 본문 + 카테고리 + 추가 메시지의 SHA-256
+    template_content = Column(Text, nullable=False)  # 발송 당시 템플릿 본문
+    category = Column(String(50))
+    additional_message = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class SendHistory(Base):
     __tablename__ = "send_history"
+    # PostgreSQL에서는 sent_at 기준 월별 파티션 테이블 (migrations/partition_send_history.sql, PK는 (id, sent_at))
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     template_id = Column(Integer, ForeignKey("templates.id", ondelete="RESTRICT"), nullable=False)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
     campaign_name = Column(String(200), nullable=False)
-    message_content = Column(Text, nullable=False)
+    message_content = Column(Text)  # 본문 참조(body_id)로 저장한 경우 null - content로 조회
+    body_id = Column(Integer, ForeignKey("message_bodies.id", ondelete="RESTRICT"))
+    company_name = Column(String(100))  # 발송 당시 발주사명 (본문 복원용)
     status = Column(String(20), nullable=False)
     solapi_message_id = Column(String(100))
+    batch_id = Column(String(64))  # 일괄 발송 요청 단위 (멱등성 키)
     sent_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
@@ -71,4 +106,65 @@ class SendHistory(Base):
             "status IN ('성공', '실패', '재발송성공', '재발송실패')",
             name="chk_status"
         ),
-    )
\ No newline at end of file
+        # 발송 이력 조회용 (최신순 정렬, 발주사/캠페인/상태 필터)
+        Index("ix_send_history_sent_at", "sent_at"),
+        Index("ix_send_history_company_sent_at", "company_id", "sent_at"),
+        Index("ix_send_history_campaign_name", "campaign_name"),
+        Index("ix_send_history_status", "status"),
+        # 재요청 시 이미 발송된 (템플릿, 발주사, 캠페인) 확인용
+        Index("ix_send_history_batch", "batch_id", "template_id", "company_id", "campaign_name"),
+    )
+
+    body = relationship(MessageBody, lazy="selectin")
+
+    @property
+    def content(self) -> str:
+        """메시지 내용 (본문 참조로 저장된 경우 본문과 발송 당시 발주사명/캠페인명으로 복원)"""
+        if self.message_content is not None or self.body is None:
+            return self.message_content
+        from app.send.bodies import render_content
+        return render_content(self.body, self.company_name, self.campaign_name)
+
+
+class SendStatDaily(Base):
+    """일별 발송 통계 (발송 이력 저장 시 함께 누적)"""
+    __tablename__ = "send_stats_daily"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    stat_date = Column(Date, nullable=False)  # SEND_SCHEDULE_TIMEZONE 기준 날짜
+    template_id = Column(Integer, ForeignKey("templates.id", ondelete="CASCADE"), nullable=False)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    success_count = Column(Integer, nullable=False, default=0)  # 성공, 재발송성공
+    fail_count = Column(Integer, nullable=False, default=0)  # 실패, 재발송실패
+
+    __table_args__ = (
+        UniqueConstraint("stat_date", "template_id", "company_id", name="uq_send_stats_daily"),
+    )
+
+
+class SendJob(Base):
+    """일괄 발송 작업 (백그라운드 처리)"""
+    __tablename__ = "send_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    template_id = Column(Integer, ForeignKey("templates.id", ondelete="CASCADE"), nullable=False)
+    batch_id = Column(String(64), unique=True)  # 멱등성 키 (발송 이력 batch_id와 동일)
+    items = Column(Text, nullable=False)  # JSON 형식
+    additional_message = Column(Text)
+    status = Column(String(20), nullable=False, default="대기")  # 예약, 대기, 진행중, 완료, 실패, 취소
+    send_at = Column(DateTime(timezone=True))  # 예약 발송 시각 (즉시 발송은 null)
+    total = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    fail_count = Column(Integer, nullable=False, default=0)
+    results = Column(Text)  # JSON 형식 (items 순서, 미처리 건은 null)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    # CheckConstraint 미사용 - 상태 추가 시 마이그레이션 부담을 피하기 위해 애플리케이션 레벨에서 관리
+    __table_args__ = (
+        # 스케줄러의 다음 예약 시각 조회용
+        Index("ix_send_jobs_status_send_at", "status", "send_at"),
+    )
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Dict, Any
+from datetime import date, datetime
 
 
 # User Schemas
@@ -124,6 +124,37 @@ class SendBulkRequest(BaseModel):
     template_id: int
     items: List[SendItem]
     additional_message: Optional[str] = None
+    # 멱등성 키: 같은 키로 재요청하면 이미 처리된 건은 다시 발송하지 않고 저장된 결과를 반환
+    idempotency_key: Optional[str] = Field(None, min_length=1, max_length=64)
+
+
+class SendJobCreateRequest(SendBulkRequest):
+    # 예약 발송 시각 (없으면 바로 발송, 시간대가 없으면 SEND_SCHEDULE_TIMEZONE 기준)
+    send_at: Optional[datetime] = None
+
+
+class SendJobCreateResponse(BaseModel):
+    job_id: int
+    batch_id: str
+    status: str
+    total: int
+    send_at: Optional[datetime] = None
+
+
+class SendJobResponse(BaseModel):
+    id: int
+    batch_id: str
+    status: str
+    total: int
+    processed: int
+    success: int
+    fail: int
+    results: List[Optional[Dict[str, Any]]]
+    error: Optional[str]
+    send_at: Optional[datetime]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
 
 
 class PreviewRequest(BaseModel):
@@ -148,10 +179,34 @@ class SendHistoryResponse(BaseModel):
     template_id: int
     company_id: int
     campaign_name: str
-    message_content: str
+    message_content: str = Field(validation_alias="content")  # 본문 참조로 저장된 이력도 복원된 내용
     status: str
     solapi_message_id: Optional[str]
+    batch_id: Optional[str] = None
     sent_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class SendHistoryPage(BaseModel):
+    items: List[SendHistoryResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 null)
+
+
+# Stats Schemas
+class SendStatsItem(BaseModel):
+    stat_date: Optional[date] = None
+    template_id: Optional[int] = None
+    template_title: Optional[str] = None
+    company_id: Optional[int] = None
+    company_name: Optional[str] = None
+    success: int
+    fail: int
+
+
+class SendStatsResponse(BaseModel):
+    group_by: str
+    success: int
+    fail: int
+    items: List[SendStatsItem]
\ No newline at end of file
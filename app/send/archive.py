@@ -0,0 +1,154 @@
+import csv
+import gzip
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from app.models import SendHistory, MessageBody
+from app.send.bodies import compose_content
+from app.send.service import filter_send_history
+from config import settings
+
+# 보관 파일 컬럼 (send_history 컬럼 순서, message_content는 본문 참조도 복원해서 저장)
+ARCHIVE_COLUMNS = [column.name for column in SendHistory.__table__.columns]
+# 보관 시 한 번에 읽는 행 수
+ARCHIVE_FETCH_SIZE = 1000
+# 미리 만들어 둘 월별 파티션 수 (이번 달 이후)
+PARTITION_MONTHS_AHEAD = 2
+
+
+def archive_send_history(
+    db: Session,
+    retention_days: Optional[int] = None,
+    archive_dir: Optional[str] = None
+) -> List[Tuple[str, int]]:
+    """
+    보존 기간이 지난 발송 이력을 월별 압축 파일로 옮기기
+
+    보존 기간(retention_days)이 지난 달을 한 달씩 gzip CSV(send_history_YYYYMM.csv.gz, UTC 기준 월)로
+    저장한 뒤 DB에서 삭제합니다. PostgreSQL 월별 파티션이 있으면 DELETE 대신 파티션을 통째로 삭제합니다.
+    파일을 모두 쓴 다음에 삭제하므로 중간에 실패해도 이력이 사라지지 않습니다.
+
+    Returns:
+        [(보관 파일 경로, 행 수), ...]
+    """
+    retention_days = retention_days if retention_days is not None else settings.SEND_HISTORY_RETENTION_DAYS
+    archive_dir = archive_dir or settings.SEND_HISTORY_ARCHIVE_DIR
+    cutoff = _month_start(datetime.now(timezone.utc) - timedelta(days=retention_days))
+
+    oldest = db.query(func.min(SendHistory.sent_at)).scalar()
+    if oldest is None:
+        return []
+    if oldest.tzinfo is None:
+        oldest = oldest.replace(tzinfo=timezone.utc)
+
+    os.makedirs(archive_dir, exist_ok=True)
+    archived = []
+    month = _month_start(oldest)
+    while month < cutoff:
+        next_month = _add_month(month)
+        path, count = _export_month(db, month, next_month, archive_dir)
+        _delete_month(db, month, next_month)
+        if path:
+            archived.append((path, count))
+            print(f"[INFO] 발송 이력 {month:%Y-%m} {count}건 보관: {path}")
+        month = next_month
+
+    return archived
+
+
+def ensure_send_history_partitions(db: Session, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """이번 달부터 months_ahead달 뒤까지 월별 파티션 생성 (PostgreSQL 파티션 마이그레이션 후에만 동작)"""
+    if not _is_partitioned(db):
+        return
+
+    month = _month_start(datetime.now(timezone.utc))
+    for _ in range(months_ahead + 1):
+        db.execute(text("SELECT create_send_history_partition(:month)"), {"month": month.date()})
+        month = _add_month(month)
+    db.commit()
+
+
+def _export_month(db: Session, start: datetime, end: datetime, archive_dir: str) -> Tuple[Optional[str], int]:
+    """한 달 치 발송 이력을 gzip CSV로 저장 (이력이 없으면 파일을 만들지 않음)"""
+    path = _archive_path(archive_dir, start)
+    temp_path = path + ".tmp"
+    count = 0
+
+    columns = [getattr(SendHistory, name) for name in ARCHIVE_COLUMNS]
+    body_columns = [MessageBody.template_content, MessageBody.category, MessageBody.additional_message]
+    query = db.query(*columns, *body_columns).outerjoin(MessageBody, MessageBody.id == SendHistory.body_id)
+    query = filter_send_history(query, start_date=start, end_date=end)
+    query = query.order_by(SendHistory.id).yield_per(ARCHIVE_FETCH_SIZE)
+
+    with gzip.open(temp_path, "wt", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(ARCHIVE_COLUMNS)
+        for row in query:
+            values = dict(zip(ARCHIVE_COLUMNS, row))
+            template_content, category, additional_message = row[len(ARCHIVE_COLUMNS):]
+            if values["message_content"] is None and template_content is not None:
+                values["message_content"] = compose_content(
+                    template_content, category, additional_message, values["company_name"], values["campaign_name"]
+                )
+            writer.writerow([_format_value(values[name]) for name in ARCHIVE_COLUMNS])
+            count += 1
+
+    if not count:
+        os.remove(temp_path)
+        return None, 0
+
+    os.replace(temp_path, path)
+    return path, count
+
+
+def _delete_month(db: Session, start: datetime, end: datetime):
+    """보관한 달의 발송 이력 삭제 (월별 파티션이 있으면 파티션 삭제)"""
+    if _is_partitioned(db):
+        partition = f"send_history_p{start:%Y%m}"
+        if db.execute(text("SELECT to_regclass(:name)"), {"name": partition}).scalar():
+            db.execute(text(f'DROP TABLE "{partition}"'))
+
+    # 파티션이 없는 DB이거나 기본 파티션에 들어간 행
+    filter_send_history(db.query(SendHistory), start_date=start, end_date=end).delete(synchronize_session=False)
+    db.commit()
+
+
+def _format_value(value):
+    """보관 파일 값 변환 (날짜는 ISO 형식, 없는 값은 빈 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _is_partitioned(db: Session) -> bool:
+    """월별 파티션 마이그레이션 적용 여부"""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(text("SELECT to_regproc('create_send_history_partition')")).scalar() is not None
+
+
+def _archive_path(archive_dir: str, month: datetime) -> str:
+    """보관 파일 경로 (같은 달 파일이 이미 있으면 번호를 붙임)"""
+    path = os.path.join(archive_dir, f"send_history_{month:%Y%m}.csv.gz")
+    n = 1
+    while os.path.exists(path):
+        path = os.path.join(archive_dir, f"send_history_{month:%Y%m}_{n}.csv.gz")
+        n += 1
+    return path
+
+
+def _month_start(value: datetime) -> datetime:
+    """UTC 기준 그 달 1일 0시"""
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def _add_month(month: datetime) -> datetime:
+    """다음 달 1일"""
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
@@ -0,0 +1,64 @@
+import hashlib
+import json
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models import MessageBody
+from app.templates.service import replace_variables
+
+
+def compose_content(
+    template_content: str,
+    category: Optional[str],
+    additional_message: Optional[str],
+    company_name: str,
+    campaign_name: str
+) -> str:
+    """템플릿 변수 치환 + 추가 메시지 (발송할 때와 이력을 복원할 때 같은 방식으로 생성)"""
+    content = replace_variables(template_content, company_name, campaign_name, category)
+
+    # 추가 메시지가 있으면 붙이기
+    if additional_message:
+        content = content + "\n\n" + additional_message
+
+    return content
+
+
+def render_content(body: MessageBody, company_name: str, campaign_name: str) -> str:
+    """저장된 본문으로 메시지 내용 복원"""
+    return compose_content(body.template_content, body.category, body.additional_message, company_name, campaign_name)
+
+
+def body_hash(template_content: str, category: Optional[str], additional_message: Optional[str]) -> str:
+    """본문 식별 해시 (템플릿 본문 + 카테고리 + 추가 메시지)"""
+    payload = json.dumps([template_content, category, additional_message or None], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_or_create_body(
+    db: Session,
+    template_content: str,
+    category: Optional[str],
+    additional_message: Optional[str]
+) -> MessageBody:
+    """같은 본문이 있으면 재사용, 없으면 생성"""
+    content_hash = body_hash(template_content, category, additional_message)
+    body = db.query(MessageBody).filter(MessageBody.content_hash == content_hash).first()
+    if body:
+        return body
+
+    body = MessageBody(
+        content_hash=content_hash,
+        template_content=template_content,
+        category=category,
+        additional_message=additional_message or None
+    )
+    db.add(body)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 같은 본문이 동시에 저장된 경우 먼저 저장된 본문 사용
+        db.rollback()
+        return db.query(MessageBody).filter(MessageBody.content_hash == content_hash).first()
+    db.refresh(body)
+    return body
@@ -0,0 +1,125 @@
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+import openpyxl
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from app.database import SessionLocal
+from app.models import SendHistory, Company, MessageBody
+from app.send.bodies import compose_content
+from app.send.service import filter_send_history
+
+# 내보내기 컬럼
+EXPORT_HEADERS = ["발송일시", "발주사아이디", "발주사명", "전화번호", "캠페인명", "상태", "메시지 내용", "SOLAPI 메시지 ID"]
+
+# DB에서 한 번에 가져오는 행 수 (서버 측 커서)
+EXPORT_FETCH_SIZE = 1000
+# CSV를 이 행 수만큼 모아서 내보냄
+CSV_FLUSH_ROWS = 500
+# XLSX 파일 전송 단위
+XLSX_CHUNK_SIZE = 64 * 1024
+
+
+def iter_history_rows(filters: Dict[str, Any]) -> Iterator[List[str]]:
+    """
+    필터에 맞는 발송 이력을 최신순으로 한 행씩 조회
+
+    yield_per로 서버 측 커서에서 EXPORT_FETCH_SIZE건씩 가져오므로 전체 건수와 관계없이 메모리 사용량이 일정합니다.
+    응답 전송 중에 사용하므로 요청 세션과 별도의 세션을 씁니다.
+    본문 참조로 저장된 메시지 내용은 본문을 함께 조회해 복원합니다.
+    """
+    db = SessionLocal()
+    try:
+        query = db.query(
+            SendHistory.sent_at, Company.company_id, Company.name, Company.phone,
+            SendHistory.campaign_name, SendHistory.status, SendHistory.solapi_message_id,
+            SendHistory.message_content, SendHistory.company_name,
+            MessageBody.template_content, MessageBody.category, MessageBody.additional_message
+        ).outerjoin(
+            Company, Company.id == SendHistory.company_id
+        ).outerjoin(
+            MessageBody, MessageBody.id == SendHistory.body_id
+        )
+        query = filter_send_history(query, **filters).order_by(
+            SendHistory.sent_at.desc(), SendHistory.id.desc()
+        ).yield_per(EXPORT_FETCH_SIZE)
+
+        for (sent_at, company_code, company_name, phone, campaign_name, status, message_id,
+             message_content, sent_company_name, template_content, category, additional_message) in query:
+            if message_content is None and template_content is not None:
+                message_content = compose_content(
+                    template_content, category, additional_message, sent_company_name, campaign_name
+                )
+            yield [
+                _format_value(value) for value in (
+                    sent_at, company_code, company_name, phone, campaign_name, status, message_content, message_id
+                )
+            ]
+    finally:
+        db.close()
+
+
+def stream_history_csv(filters: Dict[str, Any]) -> Iterator[bytes]:
+    """발송 이력 CSV 스트림 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_HEADERS)
+
+    for count, row in enumerate(iter_history_rows(filters), 1):
+        writer.writerow(row)
+        if count % CSV_FLUSH_ROWS == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_history_xlsx(filters: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    발송 이력 XLSX 스트림
+
+    write-only 모드로 행을 바로 임시 파일에 기록한 뒤 파일을 나눠서 전송하고 삭제합니다.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("발송 이력")
+    ws.append(EXPORT_HEADERS)
+    for row in iter_history_rows(filters):
+        ws.append([ILLEGAL_CHARACTERS_RE.sub("", value) for value in row])
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        wb.save(path)
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(XLSX_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+
+def export_filename(extension: str) -> str:
+    """내보내기 파일명 (send_history_YYYYMMDD_HHMMSS.확장자)"""
+    return f"send_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
+def _format_value(value: Any) -> str:
+    """셀 값 변환 (날짜는 초 단위까지, 없는 값은 빈 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
+
+
+# 형식별 (스트림 함수, MIME 타입)
+EXPORT_FORMATS: Dict[str, Tuple[Any, str]] = {
+    "csv": (stream_history_csv, "text/csv; charset=utf-8"),
+    "xlsx": (stream_history_xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
@@ -0,0 +1,122 @@
+import threading
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
+from app.database import SessionLocal
+from app.models import SendHistory
+from app.send.stats import record_send_stats
+from config import settings
+
+
+class SendHistoryWriter:
+    """
+    발송 이력 일괄 저장기
+
+    이력을 버퍼에 모았다가 flush_size건마다, 또는 flush_interval_ms가 지나면
+    한 번의 INSERT(executemany)와 커밋으로 저장합니다. 일별 통계도 같은 트랜잭션에서 누적합니다.
+    타이머 스레드가 주기적으로 비우므로 발송된 건은 최대 flush_interval_ms 안에 기록되고,
+    close()에서 남은 이력을 모두 저장합니다.
+    """
+
+    def __init__(
+        self,
+        batch_id: Optional[str] = None,
+        flush_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None
+    ):
+        self.batch_id = batch_id
+        self.flush_size = max(1, flush_size or settings.HISTORY_FLUSH_SIZE)
+        self.flush_interval = max(1, flush_interval_ms or settings.HISTORY_FLUSH_INTERVAL_MS) / 1000
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._timer = threading.Thread(target=self._flush_periodically, name="history-writer", daemon=True)
+        self._timer.start()
+
+    def __enter__(self) -> "SendHistoryWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(
+        self,
+        user_id: int,
+        template_id: int,
+        company_id: int,
+        campaign_name: str,
+        message_content: str,
+        status: str,
+        solapi_message_id: Optional[str],
+        body_id: Optional[int] = None,
+        company_name: Optional[str] = None
+    ):
+        """이력 추가 (flush_size에 도달하면 바로 저장, 본문 참조가 있으면 내용은 저장하지 않음)"""
+        with self._buffer_lock:
+            self._buffer.append({
+                "user_id": user_id,
+                "template_id": template_id,
+                "company_id": company_id,
+                "campaign_name": campaign_name,
+                "message_content": None if body_id else message_content,
+                "body_id": body_id,
+                "company_name": company_name,
+                "status": status,
+                "solapi_message_id": solapi_message_id,
+                "batch_id": self.batch_id
+            })
+            full = len(self._buffer) >= self.flush_size
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 이력을 일괄 저장 (실패 시 버퍼에 되돌려 다음 flush에서 재시도)"""
+        with self._flush_lock:
+            with self._buffer_lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return
+
+            db = SessionLocal()
+            try:
+                db.execute(insert(SendHistory), rows)
+                record_send_stats(db, rows)
+                db.commit()
+            except Exception as e:
+                print(f"[ERROR] 발송 이력 일괄 저장 실패 ({len(rows)}건): {str(e)}")
+                db.rollback()
+                with self._buffer_lock:
+                    self._buffer = rows + self._buffer
+            finally:
+                db.close()
+
+    def close(self):
+        """타이머 종료 후 남은 이력 저장 (일괄 저장이 계속 실패하면 건별로 저장)"""
+        self._closed.set()
+        self._timer.join()
+        self.flush()
+
+        with self._buffer_lock:
+            rows, self._buffer = self._buffer, []
+        if rows:
+            self._insert_one_by_one(rows)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def _insert_one_by_one(self, rows: List[Dict[str, Any]]):
+        """건별 저장 (문제가 되는 행만 제외하고 나머지는 기록)"""
+        db = SessionLocal()
+        try:
+            for row in rows:
+                try:
+                    db.execute(insert(SendHistory), [row])
+                    record_send_stats(db, [row])
+                    db.commit()
+                except Exception as e:
+                    print(f"[ERROR] 발송 이력 저장 실패 (company_id={row['company_id']}): {str(e)}")
+                    db.rollback()
+        finally:
+            db.close()
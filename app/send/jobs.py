@@ -0,0 +1,386 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.database import SessionLocal
+from app.models import SendJob
+from app.schemas import SendJobCreateRequest, SendItem
+from app.send import service
+from app.send.archive import ensure_send_history_partitions
+from config import settings
+
+# 작업 상태
+JOB_SCHEDULED = "예약"
+JOB_QUEUED = "대기"
+JOB_RUNNING = "진행중"
+JOB_COMPLETED = "완료"
+JOB_FAILED = "실패"
+JOB_CANCELED = "취소"
+
+# 아직 끝나지 않은 작업 상태 (batch_id를 선점한 것으로 간주)
+UNFINISHED_JOB_STATUSES = (JOB_SCHEDULED, JOB_QUEUED, JOB_RUNNING)
+
+# 같은 batch_id를 다른 요청이 처리 중일 때 작업을 다시 실행하기까지 대기할 초
+BATCH_BUSY_RETRY_SECONDS = 5
+
+
+def to_utc(value: datetime) -> datetime:
+    """예약 시각을 UTC로 변환 (시간대가 없으면 SEND_SCHEDULE_TIMEZONE 기준)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=ZoneInfo(settings.SEND_SCHEDULE_TIMEZONE))
+    return value.astimezone(timezone.utc)
+
+
+def _stored_utc(value: datetime) -> datetime:
+    """DB에서 읽은 예약 시각을 UTC로 변환 (SQLite는 시간대 없이 UTC로 저장됨)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def create_send_job(db: Session, user_id: int, send_data: SendJobCreateRequest) -> SendJob:
+    """
+    일괄 발송 작업 생성 (send_at이 있으면 예약, 없으면 대기 상태로 저장)
+
+    idempotency_key가 같은 작업이 이미 있으면 새로 만들지 않고 기존 작업을 반환합니다.
+    """
+    if send_data.idempotency_key:
+        existing = get_send_job_by_batch_id(db, send_data.idempotency_key)
+        if existing:
+            return existing
+
+    items = [item.model_dump() for item in send_data.items]
+    job = SendJob(
+        user_id=user_id,
+        template_id=send_data.template_id,
+        batch_id=send_data.idempotency_key or service.new_batch_id(),
+        items=json.dumps(items, ensure_ascii=False),
+        additional_message=send_data.additional_message,
+        status=JOB_SCHEDULED if send_data.send_at else JOB_QUEUED,
+        send_at=to_utc(send_data.send_at) if send_data.send_at else None,
+        total=len(items),
+        results=json.dumps([None] * len(items))
+    )
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 같은 키로 동시에 등록된 경우 먼저 저장된 작업 반환
+        db.rollback()
+        return get_send_job_by_batch_id(db, send_data.idempotency_key)
+    db.refresh(job)
+    return job
+
+
+def get_send_job(db: Session, job_id: int) -> Optional[SendJob]:
+    """ID로 발송 작업 조회"""
+    return db.query(SendJob).filter(SendJob.id == job_id).first()
+
+
+def get_send_job_by_batch_id(db: Session, batch_id: str) -> Optional[SendJob]:
+    """batch_id(멱등성 키)로 발송 작업 조회"""
+    return db.query(SendJob).filter(SendJob.batch_id == batch_id).first()
+
+
+def has_unfinished_job(batch_id: str) -> bool:
+    """batch_id를 가진 예약/대기/진행중 작업이 있는지 확인"""
+    db = SessionLocal()
+    try:
+        return db.query(SendJob.id).filter(
+            SendJob.batch_id == batch_id,
+            SendJob.status.in_(UNFINISHED_JOB_STATUSES)
+        ).first() is not None
+    finally:
+        db.close()
+
+
+def cancel_send_job(db: Session, job_id: int) -> bool:
+    """예약 발송 취소 (예약 상태가 아니면 False)"""
+    canceled = db.query(SendJob).filter(
+        SendJob.id == job_id,
+        SendJob.status == JOB_SCHEDULED
+    ).update(
+        {"status": JOB_CANCELED, "finished_at": func.now()},
+        synchronize_session=False
+    )
+    db.commit()
+    return bool(canceled)
+
+
+def job_to_response(job: SendJob) -> Dict[str, Any]:
+    """발송 작업 진행 상황 응답 생성"""
+    results = json.loads(job.results) if job.results else [None] * job.total
+    return {
+        "id": job.id,
+        "batch_id": job.batch_id,
+        "status": job.status,
+        "total": job.total,
+        "processed": sum(1 for r in results if r is not None),
+        "success": job.success_count,
+        "fail": job.fail_count,
+        "results": results,
+        "error": job.error,
+        "send_at": job.send_at,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at
+    }
+
+
+def run_send_job(job_id: int) -> bool:
+    """
+    발송 작업 실행
+
+    결과가 없는 항목만 발송하므로, 재시작으로 중단된 작업도 이어서 처리합니다.
+    작업의 batch_id로 발송하므로, 결과 저장 전에 중단되어도 이미 발송된 건은 다시 보내지 않습니다.
+    발송하는 동안 batch_id를 선점하며, 같은 batch_id를 다른 요청이 처리 중이면 작업을 대기 상태로 두고 False를 반환합니다.
+
+    Returns:
+        작업을 처리했거나 처리할 필요가 없으면 True, 나중에 다시 실행해야 하면 False
+    """
+    db = SessionLocal()
+    batch_id = None
+    try:
+        job = get_send_job(db, job_id)
+        if not job or job.status not in (JOB_QUEUED, JOB_RUNNING):
+            return True
+
+        # 직접 발송/재발송 요청과 같은 batch_id를 동시에 발송하지 않도록 선점
+        if not service.claim_batch(job.batch_id):
+            return False
+        batch_id = job.batch_id
+
+        # 대기 -> 진행중 (다른 워커가 이미 끝낸 작업은 건너뜀)
+        claimed = db.query(SendJob).filter(
+            SendJob.id == job_id,
+            SendJob.status.in_([JOB_QUEUED, JOB_RUNNING])
+        ).update(
+            {"status": JOB_RUNNING, "started_at": func.coalesce(SendJob.started_at, func.now())},
+            synchronize_session=False
+        )
+        db.commit()
+        if not claimed:
+            return True
+
+        db.refresh(job)
+        items = [SendItem(**item) for item in json.loads(job.items)]
+        results = json.loads(job.results) if job.results else [None] * len(items)
+        todo = [i for i, r in enumerate(results) if r is None]
+        lock = threading.Lock()
+
+        def on_progress(chunk_results: List[Tuple[int, Dict[str, Any]]]):
+            with lock:
+                for idx, result in chunk_results:
+                    results[todo[idx]] = result
+                _save_progress(job_id, results)
+
+        service.send_bulk(
+            user_id=job.user_id,
+            template_id=job.template_id,
+            items=[items[i] for i in todo],
+            additional_message=job.additional_message,
+            batch_id=job.batch_id,
+            on_progress=on_progress
+        )
+
+        _finish(db, job_id, JOB_COMPLETED)
+
+    except Exception as e:
+        print(f"[ERROR] 발송 작업 {job_id} 실패: {str(e)}")
+        db.rollback()
+        _finish(db, job_id, JOB_FAILED, error=str(e))
+    finally:
+        if batch_id:
+            service.release_batch(batch_id)
+        db.close()
+    return True
+
+
+def _save_progress(job_id: int, results: List[Optional[Dict[str, Any]]]):
+    """진행 상황 저장 (항목별 결과, 성공/실패 건수)"""
+    db = SessionLocal()
+    try:
+        success_count = sum(1 for r in results if r is not None and r["success"])
+        fail_count = sum(1 for r in results if r is not None and not r["success"])
+        db.query(SendJob).filter(SendJob.id == job_id).update(
+            {
+                "results": json.dumps(results, ensure_ascii=False),
+                "success_count": success_count,
+                "fail_count": fail_count
+            },
+            synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _finish(db: Session, job_id: int, status: str, error: Optional[str] = None):
+    """작업 종료 상태 저장"""
+    db.query(SendJob).filter(SendJob.id == job_id).update(
+        {"status": status, "error": error, "finished_at": func.now()},
+        synchronize_session=False
+    )
+    db.commit()
+
+
+class SendJobWorker:
+    """프로세스 내 발송 작업 워커 (별도 브로커 없이 DB에 저장된 작업 처리)"""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._active = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """워커 시작 및 미완료 작업 복구 (서버 재시작 대비)"""
+        db = SessionLocal()
+        try:
+            unfinished = db.query(SendJob.id).filter(
+                SendJob.status.in_([JOB_QUEUED, JOB_RUNNING])
+            ).order_by(SendJob.id).all()
+        finally:
+            db.close()
+
+        for (job_id,) in unfinished:
+            self.submit(job_id)
+        if unfinished:
+            print(f"[INFO] 미완료 발송 작업 {len(unfinished)}건 재개")
+
+    def submit(self, job_id: int):
+        """작업 실행 요청 (이미 실행 중인 작업은 무시)"""
+        with self._lock:
+            if job_id in self._active:
+                return
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="send-job")
+            self._active.add(job_id)
+            self.executor.submit(self._run, job_id)
+
+    def _run(self, job_id: int):
+        done = True
+        try:
+            done = run_send_job(job_id)
+        finally:
+            with self._lock:
+                self._active.discard(job_id)
+        if not done:
+            # 같은 batch_id를 다른 요청이 처리 중 - 대기 상태로 두고 나중에 다시 실행
+            timer = threading.Timer(BATCH_BUSY_RETRY_SECONDS, self.submit, args=(job_id,))
+            timer.daemon = True
+            timer.start()
+
+    def shutdown(self):
+        """워커 종료 (대기 중인 작업은 다음 시작 시 재개)"""
+        with self._lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+class SendJobScheduler:
+    """
+    예약 발송 스케줄러
+
+    (status, send_at) 인덱스로 가장 이른 예약 시각 하나만 조회해 그때까지 잠들고,
+    예약 시각이 된 작업을 대기 상태로 바꿔 발송 작업 워커에 넘깁니다.
+    예약 등록/취소 시 notify()로 바로 깨우며, 예약은 DB에 저장되므로 재시작 후에도 이어서 처리됩니다.
+    다른 프로세스가 등록한 예약도 max_sleep초 안에 확인합니다.
+    하루에 한 번(UTC 날짜가 바뀔 때) 발송 이력 월별 파티션도 미리 만들어, 재시작 없이 오래 실행해도
+    새 이력이 기본 파티션에 쌓이지 않게 합니다.
+    """
+
+    def __init__(self, worker: SendJobWorker, max_sleep: float):
+        self.worker = worker
+        self.max_sleep = max(1.0, max_sleep)
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._partitions_checked_on = None
+
+    def start(self):
+        """스케줄러 시작 (지난 예약은 바로 발송)"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="send-scheduler", daemon=True)
+        self._thread.start()
+
+    def notify(self):
+        """예약 변경 알림 (다음 예약 시각 다시 계산)"""
+        self._wake.set()
+
+    def shutdown(self):
+        """스케줄러 종료"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._ensure_partitions()
+            try:
+                timeout = self._dispatch_due()
+            except Exception as e:
+                print(f"[ERROR] 예약 발송 처리 실패: {str(e)}")
+                timeout = self.max_sleep
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def _ensure_partitions(self):
+        """발송 이력 월별 파티션 생성 (하루에 한 번, 실패하면 다음 루프에서 다시 시도)"""
+        today = datetime.now(timezone.utc).date()
+        if self._partitions_checked_on == today:
+            return
+        db = SessionLocal()
+        try:
+            ensure_send_history_partitions(db)
+            self._partitions_checked_on = today
+        except Exception as e:
+            db.rollback()
+            print(f"[ERROR] 발송 이력 파티션 생성 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _dispatch_due(self) -> float:
+        """예약 시각이 된 작업을 워커에 넘기고 다음 예약까지 대기할 시간(초) 반환"""
+        now = datetime.now(timezone.utc)
+        db = SessionLocal()
+        try:
+            due = db.query(SendJob.id).filter(
+                SendJob.status == JOB_SCHEDULED,
+                SendJob.send_at <= now
+            ).order_by(SendJob.send_at).all()
+
+            for (job_id,) in due:
+                # 예약 -> 대기 (다른 프로세스가 먼저 넘긴 작업은 건너뜀)
+                claimed = db.query(SendJob).filter(
+                    SendJob.id == job_id,
+                    SendJob.status == JOB_SCHEDULED
+                ).update({"status": JOB_QUEUED}, synchronize_session=False)
+                db.commit()
+                if claimed:
+                    print(f"[INFO] 예약 발송 작업 {job_id} 시작")
+                    self.worker.submit(job_id)
+
+            next_at = db.query(func.min(SendJob.send_at)).filter(SendJob.status == JOB_SCHEDULED).scalar()
+        finally:
+            db.close()
+
+        if next_at is None:
+            return self.max_sleep
+        wait = (_stored_utc(next_at) - datetime.now(timezone.utc)).total_seconds()
+        return min(self.max_sleep, max(0.0, wait))
+
+
+# 싱글톤 인스턴스
+send_job_worker = SendJobWorker(settings.SEND_JOB_WORKERS)
+send_job_scheduler = SendJobScheduler(send_job_worker, settings.SEND_SCHEDULER_MAX_SLEEP)
@@ -0,0 +1,167 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from app.send.solapi import ERROR_TIMEOUT, ERROR_NETWORK, ERROR_HTTP, ERROR_CIRCUIT_OPEN
+from config import settings
+
+# 재시도 판단용 오류 분류
+RETRY_TIMEOUT = "timeout"            # 요청 시간 초과
+RETRY_NETWORK = "network"            # 연결 오류
+RETRY_RATE_LIMITED = "rate_limited"  # HTTP 429
+RETRY_SERVER_ERROR = "server_error"  # HTTP 5xx
+
+# 발송 성공/실패로 보는 상태
+SUCCESS_STATUSES = ("성공", "재발송성공")
+FAILED_STATUSES = ("실패", "재발송실패")
+
+Message = Tuple[str, str]
+Outcome = Tuple[Dict[str, Any], int]  # (최종 결과, 시도 횟수)
+
+
+class RetryPolicy:
+    """
+    SOLAPI 발송 재시도 정책
+
+    재시도 가능한 오류(기본값: 시간 초과, 연결 오류, 429, 5xx)만 최대 max_attempts회까지
+    지수 백오프(base * 2^(n-1), 최대 cap)로 재시도합니다.
+    jitter가 켜져 있으면 0~백오프 사이 임의 시간(full jitter)만큼 기다리고,
+    응답에 Retry-After가 있으면 그보다 먼저 재시도하지 않고, max_wait초보다 길면 기다리지 않고 실패로 끝냅니다
+    (요청 스레드/발송 워커가 오래 멈추지 않도록).
+    번호 오류 같은 4xx/건별 거부는 재시도하지 않습니다.
+    다건 발송(send-many)은 요청이 SOLAPI에 전달되기 전의 연결 실패만 시간 초과/연결 오류로 분류되고,
+    요청 후 응답을 받지 못한 경우는 이미 발송됐을 수 있으므로 ERROR_UNKNOWN으로 재시도하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_cap: Optional[float] = None,
+        jitter: Optional[bool] = None,
+        retry_on: Optional[Iterable[str]] = None,
+        max_wait: Optional[float] = None
+    ):
+        self.max_attempts = max(1, max_attempts if max_attempts is not None else settings.SEND_RETRY_MAX_ATTEMPTS)
+        self.backoff_base = backoff_base if backoff_base is not None else settings.SEND_RETRY_BACKOFF_BASE
+        self.backoff_cap = backoff_cap if backoff_cap is not None else settings.SEND_RETRY_BACKOFF_CAP
+        self.jitter = jitter if jitter is not None else settings.SEND_RETRY_JITTER
+        self.max_wait = max_wait if max_wait is not None else settings.SEND_RETRY_MAX_WAIT
+        if retry_on is None:
+            retry_on = [c.strip() for c in settings.SEND_RETRY_ON.split(",") if c.strip()]
+        self.retry_on = set(retry_on)
+
+    def error_class(self, result: Dict[str, Any]) -> Optional[str]:
+        """실패 결과의 재시도 분류 (재시도 대상이 아닌 오류는 None)"""
+        error_type = result.get("error_type")
+        if error_type == ERROR_TIMEOUT:
+            return RETRY_TIMEOUT
+        if error_type == ERROR_NETWORK:
+            return RETRY_NETWORK
+        if error_type == ERROR_HTTP:
+            status_code = result.get("status_code") or 0
+            if status_code == 429:
+                return RETRY_RATE_LIMITED
+            if status_code >= 500:
+                return RETRY_SERVER_ERROR
+        return None
+
+    def should_retry(self, result: Dict[str, Any], attempt: int) -> bool:
+        """attempt번째 시도 결과를 보고 재시도할지 판단"""
+        if result["success"] or attempt >= self.max_attempts:
+            return False
+        # Retry-After가 최대 대기 시간보다 길면 재시도하지 않음
+        if (result.get("retry_after") or 0) > self.max_wait:
+            return False
+        return self.error_class(result) in self.retry_on
+
+    def delay(self, attempt: int, results: Iterable[Dict[str, Any]] = ()) -> float:
+        """attempt번째 시도 후 다음 시도까지 대기 시간 (초)"""
+        backoff = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        retry_after = max((r.get("retry_after") or 0 for r in results), default=0)
+        return max(backoff, retry_after)
+
+    def send(self, send_many: Callable[[List[Message]], List[Dict[str, Any]]], messages: List[Message]) -> List[Outcome]:
+        """
+        재시도 포함 발송
+
+        Args:
+            send_many: [(수신 번호, 내용), ...]를 받아 건별 결과 리스트를 반환하는 발송 함수
+            messages: 발송할 메시지 목록
+
+        Returns:
+            messages 순서의 (최종 결과, 시도 횟수) 리스트
+        """
+        outcomes: List[Optional[Outcome]] = [None] * len(messages)
+        todo = list(range(len(messages)))
+        attempt = 1
+        while todo:
+            retry = self._collect(outcomes, todo, send_many([messages[i] for i in todo]), attempt)
+            if not retry:
+                break
+            time.sleep(self.delay(attempt, (outcomes[i][0] for i in retry)))
+            todo = retry
+            attempt += 1
+        return outcomes
+
+    async def send_async(
+        self,
+        send_many: Callable[[List[Message]], Awaitable[List[Dict[str, Any]]]],
+        messages: List[Message]
+    ) -> List[Outcome]:
+        """재시도 포함 발송 (비동기, send와 동일한 결과 형식)"""
+        outcomes: List[Optional[Outcome]] = [None] * len(messages)
+        todo = list(range(len(messages)))
+        attempt = 1
+        while todo:
+            retry = self._collect(outcomes, todo, await send_many([messages[i] for i in todo]), attempt)
+            if not retry:
+                break
+            await asyncio.sleep(self.delay(attempt, (outcomes[i][0] for i in retry)))
+            todo = retry
+            attempt += 1
+        return outcomes
+
+    def _collect(
+        self,
+        outcomes: List[Optional[Outcome]],
+        todo: List[int],
+        results: List[Dict[str, Any]],
+        attempt: int
+    ) -> List[int]:
+        """시도 결과를 기록하고 재시도할 순번 목록 반환"""
+        retry = []
+        for i, result in zip(todo, results):
+            outcomes[i] = (result, attempt)
+            if self.should_retry(result, attempt):
+                retry.append(i)
+        return retry
+
+
+def outcome_to_status(result: Dict[str, Any], attempts: int) -> Dict[str, Any]:
+    """
+    최종 결과를 발송 상태로 변환
+
+    - 1차 성공: 성공 / 재시도 후 성공: 재발송성공
+    - 재시도 후 실패, 장애 차단기로 발송하지 못함: 재발송실패
+    - 재시도 대상이 아닌 오류로 1차 실패: 실패
+    """
+    if result["success"]:
+        return {
+            "success": True,
+            "status": "성공" if attempts == 1 else "재발송성공",
+            "message_id": result.get("message_id")
+        }
+    return {
+        "success": False,
+        "status": "실패" if attempts == 1 and result.get("error_type") != ERROR_CIRCUIT_OPEN else "재발송실패",
+        "error": result.get("error", "알 수 없는 오류"),
+        "message_id": None
+    }
+
+
+# 기본 재시도 정책
+default_retry_policy = RetryPolicy()
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime, timezone
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
-from app.schemas import SendBulkRequest, PreviewRequest, PreviewResponse, SendHistoryResponse
-from app.send import service
+from app.schemas import (
+    SendBulkRequest, PreviewRequest, PreviewResponse, SendHistoryResponse, SendHistoryPage,
+    SendJobCreateRequest, SendJobCreateResponse, SendJobResponse, SendStatsResponse
+)
+from app.send import service, jobs, export, stats
 from app.templates.service import replace_variables
 from app.companies.service import get_company_by_id
 from app.templates.service import get_template_by_id
@@ -12,6 +18,41 @@ from app.auth.router import get_current_user
 router = APIRouter(prefix="/api/send", tags=["send"])
 
 
+def claim_batch(batch_id: str):
+    """batch_id 선점 (같은 batch_id를 다른 요청이나 아직 끝나지 않은 발송 작업이 처리 중이면 409)"""
+    if not service.claim_batch(batch_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="같은 요청이 이미 처리 중입니다"
+        )
+    if jobs.has_unfinished_job(batch_id):
+        service.release_batch(batch_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="같은 batch_id의 발송 작업이 처리 중입니다"
+        )
+
+
+def claim_batch_id(send_data: SendBulkRequest) -> str:
+    """요청의 batch_id 결정 및 선점 (같은 멱등성 키의 요청이나 발송 작업이 처리 중이면 409)"""
+    if not send_data.idempotency_key:
+        batch_id = service.new_batch_id()
+        service.claim_batch(batch_id)
+        return batch_id
+    claim_batch(send_data.idempotency_key)
+    return send_data.idempotency_key
+
+
+def release_request_session(db: Session):
+    """
+    요청 세션의 DB 연결 반환 (발송 전에 호출)
+
+    로그인 확인(get_current_user)과 같은 세션이라 응답이 끝날 때까지 연결을 잡고 있게 되는데,
+    발송은 자체 세션을 쓰므로 발송하는 동안 연결 풀을 차지하지 않도록 먼저 닫습니다.
+    """
+    db.close()
+
+
 @router.post("/preview", response_model=PreviewResponse)
 def preview_message(
     preview_data: PreviewRequest,
@@ -65,32 +106,60 @@ def send_bulk_messages(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """일괄 발송 (순차 처리)"""
-    results = []
+    """일괄 발송 (동시 처리, 결과는 요청 순서 유지 - 같은 idempotency_key로 재요청하면 저장된 결과 반환)"""
+    release_request_session(db)
+    batch_id = claim_batch_id(send_data)
+    try:
+        results = service.send_bulk(
+            user_id=current_user.id,
+            template_id=send_data.template_id,
+            items=send_data.items,
+            additional_message=send_data.additional_message,
+            batch_id=batch_id
+        )
+    finally:
+        service.release_batch(batch_id)
 
-    for item in send_data.items:
-        result = service.send_message_with_retry(
-            db=db,
+    # 성공/실패 통계
+    success_count = sum(1 for r in results if r["success"])
+    fail_count = len(results) - success_count
+
+    return {
+        "batch_id": batch_id,
+        "total": len(results),
+        "success": success_count,
+        "fail": fail_count,
+        "results": results
+    }
+
+
+@router.post("/bulk/async")
+async def send_bulk_messages_async(
+    send_data: SendBulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """일괄 발송 (비동기 처리, /bulk와 동일한 응답 형식)"""
+    await asyncio.to_thread(release_request_session, db)
+    # 발송 작업 조회(DB)가 이벤트 루프를 막지 않도록 스레드에서 선점
+    batch_id = await asyncio.to_thread(claim_batch_id, send_data)
+    try:
+        results = await service.send_bulk_async(
             user_id=current_user.id,
             template_id=send_data.template_id,
-            company_id=item.company_id,
-            campaign_name=item.campaign_name,
-            additional_message=send_data.additional_message
+            items=send_data.items,
+            additional_message=send_data.additional_message,
+            batch_id=batch_id
         )
-        results.append({
-            "company_id": item.company_id,
-            "campaign_name": item.campaign_name,
-            "status": result["status"],
-            "success": result["success"],
-            "message_id": result.get("message_id"),
-            "error": result.get("error")
-        })
+    finally:
+        service.release_batch(batch_id)
 
     # 성공/실패 통계
     success_count = sum(1 for r in results if r["success"])
     fail_count = len(results) - success_count
 
     return {
+        "batch_id": batch_id,
         "total": len(results),
         "success": success_count,
         "fail": fail_count,
@@ -98,13 +167,222 @@ def send_bulk_messages(
     }
 
 
+@router.post("/bulk/stream")
+def send_bulk_messages_stream(
+    send_data: SendBulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """일괄 발송 (건별 결과와 누적 성공/실패 건수를 NDJSON으로 실시간 전송)"""
+    release_request_session(db)
+    batch_id = claim_batch_id(send_data)
+    return StreamingResponse(
+        service.stream_bulk(
+            user_id=current_user.id,
+            template_id=send_data.template_id,
+            items=send_data.items,
+            additional_message=send_data.additional_message,
+            batch_id=batch_id
+        ),
+        media_type="application/x-ndjson",
+        headers={"X-Batch-Id": batch_id}
+    )
+
+
+@router.post("/batches/{batch_id}/retry")
+def retry_failed_messages(
+    batch_id: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    이전 일괄 발송(batch_id)의 실패/재발송실패 건만 재발송 (/bulk와 동일한 응답 형식)
+
+    같은 batch_id를 다른 요청이나 예약/대기/진행중인 발송 작업이 처리 중이면 409를 반환합니다.
+    """
+    release_request_session(db)
+    claim_batch(batch_id)
+    try:
+        results = service.retry_failed_bulk(user_id=current_user.id, batch_id=batch_id)
+    finally:
+        service.release_batch(batch_id)
+
+    if results is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="발송 이력을 찾을 수 없습니다"
+        )
+
+    # 성공/실패 통계
+    success_count = sum(1 for r in results if r["success"])
+    fail_count = len(results) - success_count
+
+    return {
+        "batch_id": batch_id,
+        "total": len(results),
+        "success": success_count,
+        "fail": fail_count,
+        "results": results
+    }
+
+
+@router.post("/jobs", response_model=SendJobCreateResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_send_job(
+    send_data: SendJobCreateRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    일괄 발송 작업 등록 (백그라운드 처리, 진행 상황은 GET /jobs/{job_id}로 조회)
+
+    send_at이 있으면 예약 발송으로 등록하고, 예약 시각에 스케줄러가 발송을 시작합니다.
+    같은 idempotency_key로 다시 등록하면 새 작업을 만들지 않고 기존 작업을 반환합니다.
+    """
+    if send_data.send_at and jobs.to_utc(send_data.send_at) <= datetime.now(timezone.utc):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="예약 시각은 현재 시각 이후여야 합니다"
+        )
+
+    job = jobs.create_send_job(db, current_user.id, send_data)
+    if job.status == jobs.JOB_SCHEDULED:
+        jobs.send_job_scheduler.notify()
+    else:
+        jobs.send_job_worker.submit(job.id)
+    return SendJobCreateResponse(
+        job_id=job.id,
+        batch_id=job.batch_id,
+        status=job.status,
+        total=job.total,
+        send_at=job.send_at
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=SendJobResponse)
+def get_send_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """일괄 발송 작업 진행 상황 조회"""
+    job = jobs.get_send_job(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="발송 작업을 찾을 수 없습니다"
+        )
+    return jobs.job_to_response(job)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=SendJobResponse)
+def cancel_send_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """예약 발송 취소 (예약 상태인 작업만 취소 가능)"""
+    job = jobs.get_send_job(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="발송 작업을 찾을 수 없습니다"
+        )
+
+    if not jobs.cancel_send_job(db, job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="예약 상태의 작업만 취소할 수 있습니다"
+        )
+
+    jobs.send_job_scheduler.notify()
+    db.refresh(job)
+    return jobs.job_to_response(job)
+
+
+def history_filters(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    company_id: Optional[int] = None,
+    send_status: Optional[str] = Query(None, alias="status"),
+    campaign_name: Optional[str] = None
+) -> dict:
+    """
+    발송 이력 필터 (기간: start_date 이상 end_date 미만, 시간대가 없으면 SEND_SCHEDULE_TIMEZONE 기준)
+
+    start_date가 없으면 최근 SEND_HISTORY_HOT_DAYS일만 조회합니다.
+    """
+    return {
+        "start_date": jobs.to_utc(start_date) if start_date else None,
+        "end_date": jobs.to_utc(end_date) if end_date else None,
+        "company_id": company_id,
+        "status": send_status,
+        "campaign_name": campaign_name
+    }
+
+
 @router.get("/history", response_model=List[SendHistoryResponse])
 def get_send_history(
     skip: int = 0,
     limit: int = 100,
+    filters: dict = Depends(history_filters),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """발송 이력 조회 (offset 방식 - 호환용, 깊은 페이지는 /history/page 사용)"""
+    history = service.get_send_history(db, skip=skip, limit=limit, **filters)
+    return history
+
+
+@router.get("/history/page", response_model=SendHistoryPage)
+def get_send_history_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    filters: dict = Depends(history_filters),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """발송 이력 조회 (커서 방식 - 다음 페이지는 응답의 next_cursor를 cursor로 전달)"""
+    try:
+        items, next_cursor = service.get_send_history_page(db, cursor=cursor, limit=limit, **filters)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return SendHistoryPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/history/export")
+def export_send_history(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|xlsx)$"),
+    filters: dict = Depends(history_filters),
+    current_user = Depends(get_current_user)
+):
+    """발송 이력 내보내기 (CSV/XLSX, /history와 같은 필터 - 건수와 관계없이 스트리밍)"""
+    stream, media_type = export.EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        stream(filters),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={export.export_filename(export_format)}"}
+    )
+
+
+@router.get("/stats", response_model=SendStatsResponse, response_model_exclude_none=True)
+def get_send_stats(
+    group_by: str = Query(stats.GROUP_BY_DATE, pattern="^(date|template|company)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    template_id: Optional[int] = None,
+    company_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """발송 이력 조회"""
-    history = service.get_send_history(db, skip=skip, limit=limit)
-    return history
\ No newline at end of file
+    """발송 통계 (일별/템플릿별/발주사별 성공·실패 건수, 기간은 양 끝 포함)"""
+    return stats.get_send_stats(
+        db,
+        group_by=group_by,
+        start_date=start_date,
+        end_date=end_date,
+        template_id=template_id,
+        company_id=company_id
+    )
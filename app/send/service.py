@@ -1,8 +1,81 @@
-from sqlalchemy.orm import Session
+import asyncio
+import base64
+import json
+import queue
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, Session
+from app.database import SessionLocal
 from app.models import SendHistory, Company, Template
-from app.send.solapi import solapi_client
-from app.templates.service import replace_variables
-from typing import Dict, Any, Optional
+from app.schemas import SendItem
+from app.send.solapi import solapi_client, async_solapi_client
+from app.send.history import SendHistoryWriter
+from app.send.retry import default_retry_policy, outcome_to_status, SUCCESS_STATUSES, FAILED_STATUSES
+from app.send.stats import record_send_stats
+from app.send.bodies import compose_content, render_content, get_or_create_body
+from app.companies.service import get_companies_by_ids
+from config import settings
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple, Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 일괄 발송 진행 콜백: [(items 내 순번, 항목별 결과), ...]
+ProgressCallback = Callable[[List[Tuple[int, Dict[str, Any]]]], None]
+
+
+class PendingMessage(NamedTuple):
+    """발송 대기 메시지"""
+    idx: int  # items 내 순번
+    item: Any
+    phone: str
+    content: str
+    body_id: Optional[int] = None  # 본문 참조 (없으면 이력에 내용 전체 저장)
+    company_name: Optional[str] = None
+
+
+# 처리 중인 batch_id (같은 멱등성 키로 동시에 들어온 재요청 차단)
+_active_batches = set()
+_active_batches_lock = threading.Lock()
+
+
+def render_message(
+    db: Session,
+    template_id: int,
+    company_id: int,
+    campaign_name: str,
+    additional_message: Optional[str] = None
+) -> Tuple[Optional[Company], Optional[str], Optional[str]]:
+    """
+    발송할 메시지 내용 생성
+
+    Returns:
+        (발주사, 메시지 내용, 에러 메시지) - 에러가 있으면 발주사/내용은 None
+    """
+    # 발주사 정보 조회
+    company = db.query(Company).filter(Company.id == company_id).first()
+    if not company:
+        return None, None, "발주사를 찾을 수 없습니다"
+
+    # 템플릿 조회
+    template = db.query(Template).filter(Template.id == template_id).first()
+    if not template:
+        return None, None, "템플릿을 찾을 수 없습니다"
+
+    return company, compose_message(template, company, campaign_name, additional_message), None
+
+
+def compose_message(
+    template: Template,
+    company: Company,
+    campaign_name: str,
+    additional_message: Optional[str] = None
+) -> str:
+    """템플릿 변수 치환 + 추가 메시지"""
+    return compose_content(template.content, template.category, additional_message, company.name, campaign_name)
 
 
 def send_message_with_retry(
@@ -19,84 +92,445 @@ def send_message_with_retry(
     Returns:
         {
             "success": bool,
-            "status": str,  # "성공", "재발송성공", "재발송실패"
+            "status": str,  # "성공", "재발송성공", "재발송실패", "실패"
             "message_id": str,
             "error": str (optional)
         }
     """
-    # 발주사 정보 조회
-    company = db.query(Company).filter(Company.id == company_id).first()
-    if not company:
+    company, message_content, error = render_message(
+        db, template_id, company_id, campaign_name, additional_message
+    )
+    if error:
         return {
             "success": False,
             "status": "실패",
-            "error": "발주사를 찾을 수 없습니다",
+            "error": error,
             "message_id": None
         }
 
-    # 템플릿 조회
-    template = db.query(Template).filter(Template.id == template_id).first()
-    if not template:
-        return {
-            "success": False,
-            "status": "실패",
-            "error": "템플릿을 찾을 수 없습니다",
-            "message_id": None
-        }
+    # 재발송 정책에 따라 발송 (재시도 가능한 오류만 백오프 후 재시도)
+    [(result, attempts)] = default_retry_policy.send(
+        lambda messages: [solapi_client.send_message(*messages[0])],
+        [(company.phone, message_content)]
+    )
+    outcome = outcome_to_status(result, attempts)
 
-    # 메시지 내용 생성 (변수 치환)
-    message_content = replace_variables(
-        template.content,
-        company.name,
-        campaign_name,
-        template.category
+    save_send_history(
+        db, user_id, template_id, company_id,
+        campaign_name, message_content, outcome["status"], outcome["message_id"]
     )
+    return outcome
+
+
+def dispatch_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    제한된 동시성으로 작업 실행
+
+    최대 max_workers개(기본값: SEND_CONCURRENCY)의 작업을 동시에 실행하고,
+    결과는 입력 items 순서 그대로 반환합니다.
+    """
+    items = list(items)
+    if not items:
+        return []
 
-    # 추가 메시지가 있으면 붙이기
-    if additional_message:
-        message_content = message_content + "\n\n" + additional_message
+    workers = max(1, min(max_workers or settings.SEND_CONCURRENCY, len(items)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="send") as executor:
+        return list(executor.map(func, items))
 
-    # 1차 발송 시도
-    result = solapi_client.send_message(company.phone, message_content)
 
-    if result["success"]:
-        # 발송 성공
-        save_send_history(
-            db, user_id, template_id, company_id,
-            campaign_name, message_content, "성공", result["message_id"]
+def new_batch_id() -> str:
+    """멱등성 키가 없는 요청용 batch_id 생성"""
+    return uuid.uuid4().hex
+
+
+def claim_batch(batch_id: str) -> bool:
+    """batch_id 처리 시작 (같은 batch_id가 이미 처리 중이면 False)"""
+    with _active_batches_lock:
+        if batch_id in _active_batches:
+            return False
+        _active_batches.add(batch_id)
+        return True
+
+
+def release_batch(batch_id: str):
+    """batch_id 처리 종료"""
+    with _active_batches_lock:
+        _active_batches.discard(batch_id)
+
+
+def get_recorded_results(db: Session, batch_id: str, template_id: int) -> Dict[Tuple[int, str], SendHistory]:
+    """
+    batch_id로 이미 기록된 발송 이력 조회
+
+    (batch_id, template_id, company_id, campaign_name) 인덱스 범위 조회 한 번으로 불러오며,
+    (발주사 ID, 캠페인명)별 가장 최근 이력을 반환합니다.
+    """
+    rows = db.query(SendHistory).filter(
+        SendHistory.batch_id == batch_id,
+        SendHistory.template_id == template_id
+    ).order_by(SendHistory.id).all()
+    return {(row.company_id, row.campaign_name): row for row in rows}
+
+
+def get_failed_histories(db: Session, batch_id: str) -> Optional[List[SendHistory]]:
+    """
+    batch_id의 (템플릿, 발주사, 캠페인)별 마지막 이력 중 실패 건 조회
+
+    Returns:
+        실패 이력 리스트 (batch_id의 이력이 없으면 None)
+    """
+    rows = db.query(SendHistory).filter(SendHistory.batch_id == batch_id).order_by(SendHistory.id).all()
+    if not rows:
+        return None
+
+    latest = {(row.template_id, row.company_id, row.campaign_name): row for row in rows}
+    return [row for row in latest.values() if row.status in FAILED_STATUSES]
+
+
+def send_bulk(
+    user_id: int,
+    template_id: int,
+    items: List[Any],
+    additional_message: Optional[str] = None,
+    batch_id: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    collect: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    일괄 발송 (다건 발송 API + 동시 처리)
+
+    메시지를 모두 생성한 뒤 SOLAPI_BATCH_SIZE 단위 청크(on_progress가 있으면 SEND_PROGRESS_CHUNK_SIZE 단위)로 나눠 send-many로 발송하고,
+    청크들은 dispatch_concurrently로 동시에 처리합니다.
+    실패 건은 재발송 정책(RetryPolicy)에 따라 모아서 재발송하며, 이력은 SendHistoryWriter로 일괄 저장합니다.
+
+    Args:
+        batch_id: 멱등성 키 - 같은 batch_id로 이미 기록된 (발주사, 캠페인)은 다시 발송하지 않고 저장된 결과를 반환
+        on_progress: 결과가 확정될 때마다 [(순번, 결과), ...]로 호출 (발송 스레드에서 호출됨)
+        collect: False면 결과를 모아두지 않음 (on_progress로만 전달, 빈 리스트 반환)
+
+    Returns:
+        요청 items 순서와 동일한 항목별 결과 리스트
+    """
+    batch_id = batch_id or new_batch_id()
+    results, pending = _render_bulk(template_id, items, additional_message, batch_id)
+    if on_progress:
+        settled = [(idx, r) for idx, r in enumerate(results) if r is not None]
+        if settled:
+            on_progress(settled)
+
+    _send_pending(user_id, template_id, batch_id, pending, results, max_workers, on_progress, collect)
+    return results if collect else []
+
+
+def retry_failed_bulk(
+    user_id: int,
+    batch_id: str,
+    max_workers: Optional[int] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    이전 일괄 발송의 실패 건만 재발송
+
+    batch_id의 마지막 상태가 실패/재발송실패인 건만 저장된 메시지 내용 그대로
+    send_bulk와 같은 경로(send-many + 동시 처리 + 재시도)로 다시 보냅니다.
+    새 이력도 같은 batch_id(와 본문 참조)로 기록되므로, 이후 같은 키로 재요청하면 재발송 결과가 반환됩니다.
+
+    Returns:
+        재발송한 건의 항목별 결과 리스트 (batch_id의 이력이 없으면 None)
+    """
+    db = SessionLocal()
+    try:
+        failed = get_failed_histories(db, batch_id)
+        if failed is None:
+            return None
+        companies = get_companies_by_ids(db, (row.company_id for row in failed))
+    finally:
+        db.close()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(failed)
+    pending_by_template: Dict[int, List[PendingMessage]] = {}
+    for idx, row in enumerate(failed):
+        item = SendItem(company_id=row.company_id, campaign_name=row.campaign_name)
+        company = companies.get(row.company_id)
+        if not company:
+            results[idx] = _bulk_item_result(item, {
+                "success": False,
+                "status": "실패",
+                "error": "발주사를 찾을 수 없습니다",
+                "message_id": None
+            })
+            continue
+        pending_by_template.setdefault(row.template_id, []).append(
+            PendingMessage(idx, item, company.phone, row.content, row.body_id, row.company_name)
         )
-        return {
-            "success": True,
-            "status": "성공",
-            "message_id": result["message_id"]
-        }
-    else:
-        # 1차 실패 -> 재발송 시도
-        retry_result = solapi_client.send_message(company.phone, message_content)
-
-        if retry_result["success"]:
-            # 재발송 성공
-            save_send_history(
-                db, user_id, template_id, company_id,
-                campaign_name, message_content, "재발송성공", retry_result["message_id"]
+
+    for template_id, pending in pending_by_template.items():
+        _send_pending(user_id, template_id, batch_id, pending, results, max_workers)
+
+    return results
+
+
+def stream_bulk(
+    user_id: int,
+    template_id: int,
+    items: List[Any],
+    additional_message: Optional[str] = None,
+    batch_id: Optional[str] = None
+) -> Iterator[str]:
+    """
+    일괄 발송 진행 스트림 (NDJSON)
+
+    발송 스레드는 이 함수를 호출할 때 바로 시작하고, 반환한 제너레이터가 결과가 확정되는 대로 한 줄씩 내보냅니다.
+    클라이언트 연결이 끊기거나 응답 본문을 한 번도 읽지 않아도 발송은 끝까지 진행됩니다.
+    batch_id는 claim_batch로 선점한 상태로 넘기며, 발송이 끝나면 발송 스레드가 해제합니다.
+
+    Returns (NDJSON 줄):
+        {"type": "result", "index", ...항목 결과, "processed", "success_total", "fail_total", "total"}
+        {"type": "done", "total", "success", "fail"} 또는 {"type": "error", "error"}
+    """
+    events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+    def run():
+        try:
+            send_bulk(
+                user_id=user_id,
+                template_id=template_id,
+                items=items,
+                additional_message=additional_message,
+                batch_id=batch_id,
+                on_progress=lambda chunk_results: events.put(("results", chunk_results)),
+                collect=False
             )
-            return {
-                "success": True,
-                "status": "재발송성공",
-                "message_id": retry_result["message_id"]
-            }
-        else:
-            # 재발송 실패
-            save_send_history(
-                db, user_id, template_id, company_id,
-                campaign_name, message_content, "재발송실패", None
+            events.put(("done", None))
+        except Exception as e:
+            events.put(("error", str(e)))
+        finally:
+            if batch_id:
+                release_batch(batch_id)
+
+    threading.Thread(target=run, name="send-stream", daemon=True).start()
+    return _stream_events(events, len(items))
+
+
+def _stream_events(events: "queue.Queue[Tuple[str, Any]]", total: int) -> Iterator[str]:
+    """발송 스레드가 넣는 이벤트를 NDJSON 줄로 변환"""
+    processed = success_count = fail_count = 0
+    while True:
+        kind, payload = events.get()
+        if kind == "error":
+            yield json.dumps({"type": "error", "error": payload}, ensure_ascii=False) + "\n"
+            return
+        if kind == "done":
+            yield json.dumps({
+                "type": "done",
+                "total": total,
+                "success": success_count,
+                "fail": fail_count
+            }, ensure_ascii=False) + "\n"
+            return
+
+        for idx, result in payload:
+            processed += 1
+            if result["success"]:
+                success_count += 1
+            else:
+                fail_count += 1
+            yield json.dumps({
+                "type": "result",
+                "index": idx,
+                **result,
+                "processed": processed,
+                "success_total": success_count,
+                "fail_total": fail_count,
+                "total": total
+            }, ensure_ascii=False) + "\n"
+
+
+async def send_bulk_async(
+    user_id: int,
+    template_id: int,
+    items: List[Any],
+    additional_message: Optional[str] = None,
+    batch_id: Optional[str] = None,
+    max_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    일괄 발송 (비동기, send_bulk와 동일한 결과 형식)
+
+    SOLAPI 요청은 이벤트 루프에서 AsyncSolapiClient로 동시에 보내고,
+    DB 작업(메시지 생성, 이력 저장)만 스레드에서 실행합니다.
+    """
+    batch_id = batch_id or new_batch_id()
+    results, pending = await asyncio.to_thread(_render_bulk, template_id, items, additional_message, batch_id)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.SEND_CONCURRENCY))
+
+    async def send_chunk(chunk) -> List[Tuple[int, Dict[str, Any]]]:
+        async with semaphore:
+            outcomes = await default_retry_policy.send_async(
+                async_solapi_client.send_messages,
+                [(message.phone, message.content) for message in chunk]
             )
-            return {
-                "success": False,
-                "status": "재발송실패",
-                "error": retry_result.get("error", "알 수 없는 오류"),
-                "message_id": None
-            }
+
+        return await asyncio.to_thread(_record_chunk, history_writer, user_id, template_id, chunk, outcomes)
+
+    history_writer = SendHistoryWriter(batch_id=batch_id)
+    try:
+        chunk_results_list = await asyncio.gather(*(send_chunk(chunk) for chunk in _chunk_pending(pending)))
+    finally:
+        await asyncio.to_thread(history_writer.close)
+    for chunk_results in chunk_results_list:
+        for idx, result in chunk_results:
+            results[idx] = result
+
+    return results
+
+
+def _render_bulk(
+    template_id: int,
+    items: List[Any],
+    additional_message: Optional[str],
+    batch_id: Optional[str] = None
+) -> Tuple[List[Optional[Dict[str, Any]]], List[PendingMessage]]:
+    """
+    일괄 발송 메시지 생성
+
+    템플릿은 한 번, 발주사는 IN 조회로 한꺼번에 불러와 메모리에서 치환합니다.
+    이력에는 내용 대신 공유 본문(MessageBody) 참조와 발주사명만 저장합니다.
+    batch_id로 이미 기록된 항목은 저장된 결과로 채우고 발송 대기 목록에서 제외합니다.
+
+    Returns:
+        (항목별 결과 리스트 - 생성 실패/기록된 건만 채워짐, 발송 대기 목록)
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    pending = []
+
+    db = SessionLocal()
+    try:
+        # 본문을 새로 저장하면 커밋으로 세션의 객체가 만료되므로, 이력 조회보다 먼저 처리
+        template = db.query(Template).filter(Template.id == template_id).first()
+        body = get_or_create_body(db, template.content, template.category, additional_message) if template else None
+        recorded = get_recorded_results(db, batch_id, template_id) if batch_id else {}
+        companies = get_companies_by_ids(
+            db, (item.company_id for item in items if (item.company_id, item.campaign_name) not in recorded)
+        )
+    finally:
+        db.close()
+
+    for idx, item in enumerate(items):
+        history = recorded.get((item.company_id, item.campaign_name))
+        if history:
+            results[idx] = _recorded_item_result(item, history)
+            continue
+
+        company = companies.get(item.company_id)
+        if not company:
+            error = "발주사를 찾을 수 없습니다"
+        elif not template:
+            error = "템플릿을 찾을 수 없습니다"
+        else:
+            # 이력 조회 때와 같은 본문으로 생성
+            message_content = render_content(body, company.name, item.campaign_name)
+            pending.append(PendingMessage(idx, item, company.phone, message_content, body.id, company.name))
+            continue
+
+        results[idx] = _bulk_item_result(item, {
+            "success": False,
+            "status": "실패",
+            "error": error,
+            "message_id": None
+        })
+
+    return results, pending
+
+
+def _send_pending(
+    user_id: int,
+    template_id: int,
+    batch_id: str,
+    pending: List[PendingMessage],
+    results: List[Optional[Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    collect: bool = True
+):
+    """
+    발송 대기 목록을 청크 단위로 동시에 발송하고 results의 해당 순번에 결과 기록
+
+    on_progress가 있으면 SEND_PROGRESS_CHUNK_SIZE 단위로 나눠 발송합니다
+    (SOLAPI_BATCH_SIZE 단위면 수백 건 발송은 끝날 때까지 진행 상황이 한 번도 갱신되지 않음).
+    """
+    chunk_size = settings.SEND_PROGRESS_CHUNK_SIZE if on_progress else None
+
+    def send_chunk(chunk) -> List[Tuple[int, Dict[str, Any]]]:
+        outcomes = default_retry_policy.send(
+            solapi_client.send_messages,
+            [(message.phone, message.content) for message in chunk]
+        )
+
+        chunk_results = _record_chunk(history_writer, user_id, template_id, chunk, outcomes)
+        if on_progress:
+            on_progress(chunk_results)
+        return chunk_results if collect else []
+
+    with SendHistoryWriter(batch_id=batch_id) as history_writer:
+        for chunk_results in dispatch_concurrently(send_chunk, _chunk_pending(pending, chunk_size), max_workers=max_workers):
+            for idx, result in chunk_results:
+                results[idx] = result
+
+
+def _chunk_pending(pending: List[Any], chunk_size: Optional[int] = None) -> List[List[Any]]:
+    """발송 대기 목록을 send-many 요청 단위로 분할 (chunk_size가 있으면 SOLAPI_BATCH_SIZE 이하에서 그 크기로)"""
+    batch_size = solapi_client.batch_size
+    if chunk_size and chunk_size > 0:
+        batch_size = min(batch_size, chunk_size)
+    return [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+
+def _record_chunk(
+    history_writer: SendHistoryWriter,
+    user_id: int,
+    template_id: int,
+    chunk: List[PendingMessage],
+    outcomes: List[Tuple[Dict[str, Any], int]]
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """청크 발송 결과를 상태로 변환하고 발송 이력 기록"""
+    chunk_results = []
+    for message, (result, attempts) in zip(chunk, outcomes):
+        outcome = outcome_to_status(result, attempts)
+        history_writer.add(
+            user_id, template_id, message.item.company_id,
+            message.item.campaign_name, message.content, outcome["status"], outcome["message_id"],
+            body_id=message.body_id, company_name=message.company_name
+        )
+        chunk_results.append((message.idx, _bulk_item_result(message.item, outcome)))
+    return chunk_results
+
+
+def _recorded_item_result(item: Any, history: SendHistory) -> Dict[str, Any]:
+    """이미 기록된 발송 이력을 항목별 응답 형식으로 변환 (재요청 시 다시 발송하지 않음)"""
+    success = history.status in SUCCESS_STATUSES
+    return _bulk_item_result(item, {
+        "success": success,
+        "status": history.status,
+        "message_id": history.solapi_message_id,
+        "error": None if success else "이전 요청에서 발송에 실패한 건입니다"
+    })
+
+
+def _bulk_item_result(item: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    """일괄 발송 항목별 응답 형식"""
+    return {
+        "company_id": item.company_id,
+        "campaign_name": item.campaign_name,
+        "status": result["status"],
+        "success": result["success"],
+        "message_id": result.get("message_id"),
+        "error": result.get("error")
+    }
 
 
 def save_send_history(
@@ -109,7 +543,7 @@ def save_send_history(
     status: str,
     solapi_message_id: Optional[str]
 ):
-    """발송 이력 저장"""
+    """발송 이력 저장 (일별 통계도 같은 트랜잭션에서 누적)"""
     history = SendHistory(
         user_id=user_id,
         template_id=template_id,
@@ -120,12 +554,120 @@ def save_send_history(
         solapi_message_id=solapi_message_id
     )
     db.add(history)
+    record_send_stats(db, [{"template_id": template_id, "company_id": company_id, "status": status}])
     db.commit()
 
 
-def get_send_history(db: Session, skip: int = 0, limit: int = 100):
-    """발송 이력 조회"""
-    return db.query(SendHistory).order_by(SendHistory.sent_at.desc()).offset(skip).limit(limit).all()
+def get_send_history(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    company_id: Optional[int] = None,
+    status: Optional[str] = None,
+    campaign_name: Optional[str] = None
+):
+    """발송 이력 조회 (offset 방식 - 뒤 페이지일수록 느려지므로 get_send_history_page 권장)"""
+    query = filter_send_history(db.query(SendHistory), start_date, end_date, company_id, status, campaign_name)
+    return query.order_by(SendHistory.sent_at.desc(), SendHistory.id.desc()).offset(skip).limit(limit).all()
+
+
+def get_send_history_page(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    company_id: Optional[int] = None,
+    status: Optional[str] = None,
+    campaign_name: Optional[str] = None
+) -> Tuple[List[SendHistory], Optional[str]]:
+    """
+    발송 이력 조회 (커서 방식)
+
+    (sent_at, id) 최신순으로 정렬하고, 이전 페이지 마지막 행의 (sent_at, id) 다음부터 조회하므로
+    페이지 깊이와 관계없이 인덱스 범위 조회 한 번으로 처리됩니다.
+
+    Returns:
+        (이력 리스트, 다음 페이지 커서 - 마지막 페이지면 None)
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    query = filter_send_history(db.query(SendHistory), start_date, end_date, company_id, status, campaign_name)
+    if cursor:
+        sent_at, history_id = _decode_history_cursor(cursor)
+        sent_at = _bind_sent_at(query.session, sent_at)
+        query = query.filter(or_(
+            SendHistory.sent_at < sent_at,
+            and_(SendHistory.sent_at == sent_at, SendHistory.id < history_id)
+        ))
+
+    rows = query.order_by(SendHistory.sent_at.desc(), SendHistory.id.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, _encode_history_cursor(rows[-1])
+
+
+def filter_send_history(
+    query: Query,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    company_id: Optional[int] = None,
+    status: Optional[str] = None,
+    campaign_name: Optional[str] = None
+) -> Query:
+    """
+    발송 이력 조회에 필터 적용 (기간: start_date 이상 end_date 미만)
+
+    start_date가 없으면 최근 SEND_HISTORY_HOT_DAYS일만 조회합니다 (월별 파티션 중 최근 것만 읽도록).
+    """
+    if start_date is None and settings.SEND_HISTORY_HOT_DAYS > 0:
+        start_date = datetime.now(timezone.utc) - timedelta(days=settings.SEND_HISTORY_HOT_DAYS)
+    if start_date:
+        query = query.filter(SendHistory.sent_at >= _bind_sent_at(query.session, start_date))
+    if end_date:
+        query = query.filter(SendHistory.sent_at < _bind_sent_at(query.session, end_date))
+    if company_id is not None:
+        query = query.filter(SendHistory.company_id == company_id)
+    if status:
+        query = query.filter(SendHistory.status == status)
+    if campaign_name:
+        query = query.filter(SendHistory.campaign_name == campaign_name)
+    return query
+
+
+def _bind_sent_at(db: Session, value: datetime) -> Any:
+    """
+    sent_at 비교값
+
+    SQLite는 날짜를 문자열로 비교하는데, 기본값(CURRENT_TIMESTAMP)으로 저장된 값에는
+    마이크로초가 없으므로 같은 형식의 문자열로 맞춰야 같은 시각끼리 올바르게 비교됩니다.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S" if not value.microsecond else "%Y-%m-%d %H:%M:%S.%f")
+
+
+def _encode_history_cursor(history: SendHistory) -> str:
+    """다음 페이지 커서 생성 (마지막 행의 sent_at, id)"""
+    payload = json.dumps([history.sent_at.isoformat(), history.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_history_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 해석 (잘못된 커서면 ValueError)"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sent_at, history_id = json.loads(payload)
+        return datetime.fromisoformat(sent_at), int(history_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다") from e
 
 
 def calculate_message_stats(message: str) -> Dict[str, int]:
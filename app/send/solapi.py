@@ -1,10 +1,29 @@
+import asyncio
 import hmac
 import hashlib
 import secrets
+import threading
+import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+from collections import deque
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from config import settings
-from typing import Dict, Any
+from typing import Dict, Any, Deque, List, Optional, Tuple
+
+# SOLAPI send-many 1회 요청당 최대 메시지 수
+MAX_BATCH_SIZE = 10000
+
+# 실패 유형 (결과 딕셔너리의 error_type)
+ERROR_TIMEOUT = "timeout"      # 요청 시간 초과
+ERROR_NETWORK = "network"      # 연결 오류
+ERROR_HTTP = "http"            # HTTP 오류 응답 (status_code 참고)
+ERROR_REJECTED = "rejected"    # 다건 발송 중 해당 건만 거부됨 (번호 오류 등)
+ERROR_UNKNOWN = "unknown"      # 응답 해석 실패, 다건 발송 요청 후 응답 없음 등 (발송 여부를 알 수 없어 재시도하지 않음)
+ERROR_CIRCUIT_OPEN = "circuit_open"  # 장애 차단기(CircuitBreaker) open으로 요청하지 않음
 
 
 def generate_signature(api_secret: str, date_time: str, salt: str) -> str:
@@ -27,14 +46,274 @@ def create_auth_header(api_key: str, api_secret: str) -> str:
     return f"HMAC-SHA256 apiKey={api_key}, date={date_time}, salt={salt}, signature={signature}"
 
 
-class SolapiClient:
-    """SOLAPI 클라이언트"""
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate개 충전, 최대 1초 분량까지 누적)
+
+    reserve(n)는 토큰을 바로 차감하고(부족하면 음수) 그만큼 기다려야 할 시간을 반환하므로,
+    용량보다 큰 요청(예: 1000건 다건 발송)도 속도에 비례해 대기한 뒤 처리됩니다.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: float = 1) -> float:
+        """토큰 n개 예약, 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= n
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    SOLAPI 계정 단위 발송 속도 제한 (요청 수/초, 메시지 수/초)
+
+    동기/비동기 클라이언트가 같은 인스턴스를 공유하며, 0 이하로 설정한 항목은 제한하지 않습니다.
+    """
+
+    def __init__(self, requests_per_second: float, messages_per_second: float):
+        self.request_bucket = TokenBucket(requests_per_second) if requests_per_second > 0 else None
+        self.message_bucket = TokenBucket(messages_per_second) if messages_per_second > 0 else None
+        self.acquired_requests = 0
+        self.acquired_messages = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, message_count: int) -> float:
+        """요청 1회(메시지 message_count건) 예약, 대기 시간(초) 반환"""
+        wait = 0.0
+        if self.request_bucket:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.message_bucket:
+            wait = max(wait, self.message_bucket.reserve(message_count))
+
+        with self._lock:
+            self.acquired_requests += 1
+            self.acquired_messages += message_count
+            if wait > 0:
+                self.waits += 1
+                self.wait_seconds += wait
+        return wait
+
+    def acquire(self, message_count: int = 1):
+        """발송 전 대기 (동기)"""
+        wait = self.reserve(message_count)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, message_count: int = 1):
+        """발송 전 대기 (비동기)"""
+        wait = self.reserve(message_count)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기 통계"""
+        with self._lock:
+            return {
+                "requests_per_second": self.request_bucket.rate if self.request_bucket else None,
+                "messages_per_second": self.message_bucket.rate if self.message_bucket else None,
+                "acquired_requests": self.acquired_requests,
+                "acquired_messages": self.acquired_messages,
+                "waits": self.waits,
+                "wait_seconds": round(self.wait_seconds, 3)
+            }
+
+
+class CircuitBreaker:
+    """
+    SOLAPI 장애 차단기
 
-    def __init__(self):
+    - closed: 정상. 연속 장애(시간 초과/연결 오류/5xx)가 failure_threshold회이거나,
+      최근 window건 중 장애 비율이 failure_rate 이상이면 open으로 전환
+    - open: reset_timeout초 동안 요청 없이 즉시 실패 처리
+    - half_open: 복구 확인용 요청 1건만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        failure_rate: Optional[float] = None,
+        window: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ):
+        self.failure_threshold = max(1, failure_threshold or settings.SOLAPI_CIRCUIT_FAILURE_THRESHOLD)
+        self.failure_rate = failure_rate or settings.SOLAPI_CIRCUIT_FAILURE_RATE
+        self.window = max(1, window or settings.SOLAPI_CIRCUIT_WINDOW)
+        self.reset_timeout = reset_timeout or settings.SOLAPI_CIRCUIT_RESET_TIMEOUT
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.recent: Deque[bool] = deque(maxlen=self.window)  # 최근 요청 장애 여부
+        self.opened_at: Optional[float] = None
+        self.open_count = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (open 상태가 reset_timeout을 넘기면 half_open으로 전환해 1건 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # half_open: 확인 요청은 한 번에 1건만
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record(self, failed: bool):
+        """요청 결과 기록"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+                return
+
+            self.recent.append(failed)
+            if not failed:
+                self.consecutive_failures = 0
+                return
+
+            self.consecutive_failures += 1
+            failures = sum(self.recent)
+            rate_exceeded = len(self.recent) >= self.window and failures / len(self.recent) >= self.failure_rate
+            if self.state == self.CLOSED and (self.consecutive_failures >= self.failure_threshold or rate_exceeded):
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.open_count += 1
+        print(f"[WARN] SOLAPI 차단기 open (연속 장애 {self.consecutive_failures}회)")
+
+    def _close(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.recent.clear()
+        self.opened_at = None
+        print("[INFO] SOLAPI 차단기 closed (복구 확인)")
+
+    def stats(self) -> Dict[str, Any]:
+        """차단기 상태"""
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 1)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "recent_failure_rate": round(sum(self.recent) / len(self.recent), 3) if self.recent else 0.0,
+                "open_count": self.open_count,
+                "retry_in_seconds": retry_in
+            }
+
+
+class BaseSolapiClient:
+    """SOLAPI 클라이언트 공통 설정 (요청 본문 생성, 응답 해석)"""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None
+    ):
         self.api_key = settings.SOLAPI_API_KEY
         self.api_secret = settings.SOLAPI_API_SECRET
         self.sender_phone = settings.SOLAPI_SENDER_PHONE
         self.api_url = "https://api.solapi.com/messages/v4/send"
+        self.send_many_url = "https://api.solapi.com/messages/v4/send-many/detail"
+        self.batch_size = max(1, min(settings.SOLAPI_BATCH_SIZE, MAX_BATCH_SIZE))
+        self.pool_size = max(1, settings.SOLAPI_POOL_SIZE or settings.SEND_CONCURRENCY)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            settings.SOLAPI_REQUESTS_PER_SECOND,
+            settings.SOLAPI_MESSAGES_PER_SECOND
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    def _headers(self) -> Dict[str, str]:
+        """요청 헤더 생성 (요청마다 새 시그니처)"""
+        return {
+            'Authorization': create_auth_header(self.api_key, self.api_secret),
+            'Content-Type': 'application/json'
+        }
+
+    def _message_payload(self, to: str, message: str) -> Dict[str, Any]:
+        """단건 발송 요청 본문"""
+        return {
+            "message": {
+                "to": to,
+                "from": self.sender_phone,
+                "text": message
+            }
+        }
+
+    def _many_payload(self, messages: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        다건 발송 요청 본문 (customFields.seq로 응답의 건별 결과를 요청 순서에 매핑)
+
+        같은 발주사를 캠페인만 달리해 여러 번 보낼 수 있으므로 같은 수신번호 중복을 허용합니다.
+        """
+        return {
+            "messages": [
+                {
+                    "to": to,
+                    "from": self.sender_phone,
+                    "text": text,
+                    "customFields": {"seq": str(seq)}
+                }
+                for seq, (to, text) in enumerate(messages)
+            ],
+            "showMessageList": True,
+            "allowDuplicates": True
+        }
+
+    def _chunks(self, messages: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """batch_size 단위로 분할"""
+        return [messages[i:i + self.batch_size] for i in range(0, len(messages), self.batch_size)]
+
+
+class SolapiClient(BaseSolapiClient):
+    """SOLAPI 클라이언트"""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None
+    ):
+        super().__init__(rate_limiter, circuit_breaker)
+        self.timeout = (settings.SOLAPI_CONNECT_TIMEOUT, settings.SOLAPI_READ_TIMEOUT)
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """연결 재사용(keep-alive)을 위한 풀링 세션 생성"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
+    def close(self):
+        """세션 종료 (앱 종료 시 호출)"""
+        self.session.close()
 
     def send_message(self, to: str, message: str) -> Dict[str, Any]:
         """
@@ -47,63 +326,351 @@ class SolapiClient:
         Returns:
             발송 결과 딕셔너리
         """
+        if not self.circuit_breaker.allow_request():
+            return _circuit_open_failure()
+
+        result = self._post_message(to, message)
+        self.circuit_breaker.record(_is_outage(result))
+        return result
+
+    def _post_message(self, to: str, message: str) -> Dict[str, Any]:
+        """단건 발송 요청"""
         try:
-            auth_header = create_auth_header(self.api_key, self.api_secret)
+            self.rate_limiter.acquire(1)
+            response = self.session.post(
+                self.api_url,
+                json=self._message_payload(to, message),
+                headers=self._headers(),
+                timeout=self.timeout
+            )
+            return _parse_send(response)
 
-            headers = {
-                'Authorization': auth_header,
-                'Content-Type': 'application/json'
-            }
+        except requests.exceptions.Timeout:
+            return _failure("요청 시간 초과", ERROR_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            return _failure(f"네트워크 오류: {str(e)}", ERROR_NETWORK)
+        except Exception as e:
+            return _failure(f"알 수 없는 오류: {str(e)}", ERROR_UNKNOWN)
 
-            message_data = {
-                "message": {
-                    "to": to,
-                    "from": self.sender_phone,
-                    "text": message
-                }
-            }
+    def send_messages(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        다건 문자 발송 (send-many, batch_size 단위로 나눠 요청)
 
-            response = requests.post(
-                self.api_url,
-                json=message_data,
-                headers=headers,
-                timeout=30  # 타임아웃을 30초로 증가
+        Args:
+            messages: [(수신 번호, 발송 내용), ...]
+
+        Returns:
+            messages와 같은 순서의 건별 발송 결과 리스트 (send_message와 동일 형식)
+        """
+        results = []
+        for chunk in self._chunks(messages):
+            results.extend(self._send_many(chunk))
+        return results
+
+    def _send_many(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """send-many 1회 요청 (차단 중이면 요청 없이 전체 건 실패)"""
+        if not messages:
+            return []
+        if not self.circuit_breaker.allow_request():
+            return [_circuit_open_failure() for _ in messages]
+
+        results = self._post_many(messages)
+        self.circuit_breaker.record(any(_is_outage(r) for r in results))
+        return results
+
+    def _post_many(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """send-many 요청 (요청 실패 시 전체 건 실패 처리)"""
+        try:
+            self.rate_limiter.acquire(len(messages))
+            response = self.session.post(
+                self.send_many_url,
+                json=self._many_payload(messages),
+                headers=self._headers(),
+                timeout=self.timeout
             )
+            return _parse_send_many(response, len(messages))
 
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "message_id": result.get("messageId"),
-                    "status": result.get("statusCode"),
-                    "data": result
-                }
+        except requests.exceptions.ConnectTimeout:
+            failure = _failure("연결 시간 초과", ERROR_TIMEOUT)
+        except requests.exceptions.ConnectionError as e:
+            if _connect_failed(e):
+                failure = _failure(f"연결 오류: {str(e)}", ERROR_NETWORK)
             else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "message_id": None
-                }
-
+                failure = _unconfirmed_failure(f"연결이 끊어졌습니다: {str(e)}")
         except requests.exceptions.Timeout:
-            return {
-                "success": False,
-                "error": "요청 시간 초과",
-                "message_id": None
-            }
+            failure = _unconfirmed_failure("응답 시간 초과")
         except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": f"네트워크 오류: {str(e)}",
-                "message_id": None
-            }
+            failure = _unconfirmed_failure(f"네트워크 오류: {str(e)}")
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"알 수 없는 오류: {str(e)}",
-                "message_id": None
-            }
+            failure = _failure(f"알 수 없는 오류: {str(e)}", ERROR_UNKNOWN)
+
+        return [dict(failure) for _ in messages]
+
+
+class AsyncSolapiClient(BaseSolapiClient):
+    """SOLAPI 비동기 클라이언트 (httpx, 이벤트 루프에서 사용)"""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None
+    ):
+        super().__init__(rate_limiter, circuit_breaker)
+        self.timeout = httpx.Timeout(settings.SOLAPI_READ_TIMEOUT, connect=settings.SOLAPI_CONNECT_TIMEOUT)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """연결 풀을 공유하는 httpx 클라이언트 (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """클라이언트 종료 (앱 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def send_message(self, to: str, message: str) -> Dict[str, Any]:
+        """
+        문자 발송 (SolapiClient.send_message와 동일한 결과 형식)
+
+        Args:
+            to: 수신 번호
+            message: 발송 내용
+
+        Returns:
+            발송 결과 딕셔너리
+        """
+        if not self.circuit_breaker.allow_request():
+            return _circuit_open_failure()
+
+        result = await self._post_message(to, message)
+        self.circuit_breaker.record(_is_outage(result))
+        return result
+
+    async def _post_message(self, to: str, message: str) -> Dict[str, Any]:
+        """단건 발송 요청"""
+        try:
+            await self.rate_limiter.acquire_async(1)
+            response = await self.client.post(
+                self.api_url,
+                json=self._message_payload(to, message),
+                headers=self._headers()
+            )
+            return _parse_send(response)
+
+        except httpx.TimeoutException:
+            return _failure("요청 시간 초과", ERROR_TIMEOUT)
+        except httpx.HTTPError as e:
+            return _failure(f"네트워크 오류: {str(e)}", ERROR_NETWORK)
+        except Exception as e:
+            return _failure(f"알 수 없는 오류: {str(e)}", ERROR_UNKNOWN)
+
+    async def send_messages(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        다건 문자 발송 (send-many, batch_size 단위 요청을 동시에 전송)
+
+        Args:
+            messages: [(수신 번호, 발송 내용), ...]
+
+        Returns:
+            messages와 같은 순서의 건별 발송 결과 리스트
+        """
+        chunk_results = await asyncio.gather(*(self._send_many(chunk) for chunk in self._chunks(messages)))
+        return [result for results in chunk_results for result in results]
+
+    async def _send_many(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """send-many 1회 요청 (차단 중이면 요청 없이 전체 건 실패)"""
+        if not messages:
+            return []
+        if not self.circuit_breaker.allow_request():
+            return [_circuit_open_failure() for _ in messages]
+
+        results = await self._post_many(messages)
+        self.circuit_breaker.record(any(_is_outage(r) for r in results))
+        return results
+
+    async def _post_many(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """send-many 요청 (요청 실패 시 전체 건 실패 처리)"""
+        try:
+            await self.rate_limiter.acquire_async(len(messages))
+            response = await self.client.post(
+                self.send_many_url,
+                json=self._many_payload(messages),
+                headers=self._headers()
+            )
+            return _parse_send_many(response, len(messages))
+
+        except (httpx.ConnectTimeout, httpx.PoolTimeout):
+            failure = _failure("연결 시간 초과", ERROR_TIMEOUT)
+        except httpx.ConnectError as e:
+            failure = _failure(f"연결 오류: {str(e)}", ERROR_NETWORK)
+        except httpx.TimeoutException:
+            failure = _unconfirmed_failure("응답 시간 초과")
+        except httpx.HTTPError as e:
+            failure = _unconfirmed_failure(f"네트워크 오류: {str(e)}")
+        except Exception as e:
+            failure = _failure(f"알 수 없는 오류: {str(e)}", ERROR_UNKNOWN)
+
+        return [dict(failure) for _ in messages]
+
+
+def _failure(
+    error: str,
+    error_type: str,
+    status_code: Optional[int] = None,
+    retry_after: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    실패 결과 딕셔너리
+
+    error_type/status_code/retry_after는 재발송 정책(RetryPolicy)이 재시도 여부를 판단하는 데 사용합니다.
+    """
+    return {
+        "success": False,
+        "error": error,
+        "error_type": error_type,
+        "status_code": status_code,
+        "retry_after": retry_after,
+        "message_id": None
+    }
+
+
+def _unconfirmed_failure(error: str) -> Dict[str, Any]:
+    """
+    다건 발송 요청을 보낸 뒤 응답을 받지 못한 실패 결과
+
+    SOLAPI가 이미 발송했을 수 있으므로 재시도하지 않도록 ERROR_UNKNOWN으로 처리하고,
+    장애 차단기에는 장애로 기록합니다.
+    """
+    failure = _failure(f"발송 결과를 확인할 수 없습니다 ({error})", ERROR_UNKNOWN)
+    failure["outage"] = True
+    return failure
+
+
+def _connect_failed(error: requests.exceptions.ConnectionError) -> bool:
+    """연결 단계에서 실패해 요청이 SOLAPI에 전달되지 않았는지 (요청 중 연결이 끊긴 경우는 False)"""
+    reason = error.args[0] if error.args else None
+    return isinstance(reason, MaxRetryError) and isinstance(reason.reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _circuit_open_failure() -> Dict[str, Any]:
+    """차단기 open 상태 실패 결과"""
+    return _failure("SOLAPI 장애로 발송이 일시 차단되었습니다 (잠시 후 다시 시도하세요)", ERROR_CIRCUIT_OPEN)
+
+
+def _is_outage(result: Dict[str, Any]) -> bool:
+    """SOLAPI 장애로 볼 수 있는 실패인지 (시간 초과, 연결 오류, 응답 없음, 5xx)"""
+    if result.get("outage"):
+        return True
+    error_type = result.get("error_type")
+    if error_type in (ERROR_TIMEOUT, ERROR_NETWORK):
+        return True
+    return error_type == ERROR_HTTP and (result.get("status_code") or 0) >= 500
+
+
+def _http_failure(response: Any) -> Dict[str, Any]:
+    """HTTP 오류 응답을 실패 결과로 변환 (429/5xx의 Retry-After 포함)"""
+    return _failure(
+        f"HTTP {response.status_code}: {response.text}",
+        ERROR_HTTP,
+        status_code=response.status_code,
+        retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+    )
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 해석 (초 또는 HTTP 날짜)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_send(response: Any) -> Dict[str, Any]:
+    """단건 발송 응답을 결과로 변환 (requests/httpx 응답 공통)"""
+    if response.status_code != 200:
+        return _http_failure(response)
+
+    result = response.json()
+    return {
+        "success": True,
+        "message_id": result.get("messageId"),
+        "status": result.get("statusCode"),
+        "data": result
+    }
+
+
+def _parse_send_many(response: Any, count: int) -> List[Dict[str, Any]]:
+    """
+    send-many 응답을 건별 결과로 변환 (requests/httpx 응답 공통)
+
+    messageList에 있는 건은 접수 성공, failedMessageList에 있는 건은 실패,
+    어느 쪽에도 없는 건은 결과를 알 수 없는 실패(ERROR_UNKNOWN)로 처리합니다.
+    """
+    if response.status_code != 200:
+        failure = _http_failure(response)
+        return [dict(failure) for _ in range(count)]
+
+    data = response.json()
+
+    def seq_of(entry: Dict[str, Any]) -> Optional[int]:
+        try:
+            return int((entry.get("customFields") or {}).get("seq"))
+        except (TypeError, ValueError):
+            return None
+
+    accepted = {}
+    for entry in data.get("messageList") or []:
+        seq = seq_of(entry)
+        if seq is not None:
+            accepted[seq] = entry
+
+    failed = {}
+    for entry in data.get("failedMessageList") or []:
+        seq = seq_of(entry)
+        if seq is not None:
+            failed[seq] = entry
+
+    results = []
+    for seq in range(count):
+        if seq in failed:
+            entry = failed[seq]
+            results.append(_failure(
+                f"{entry.get('statusCode', '')}: {entry.get('statusMessage', '발송 실패')}",
+                ERROR_REJECTED
+            ))
+        elif seq not in accepted:
+            # 접수/실패 어느 쪽에도 없으면 발송 여부를 알 수 없음 (재시도하면 중복 발송될 수 있어 실패로 기록)
+            results.append(_failure("발송 결과를 확인할 수 없습니다 (응답에 없음)", ERROR_UNKNOWN))
+        else:
+            entry = accepted[seq]
+            results.append({
+                "success": True,
+                "message_id": entry.get("messageId"),
+                "status": entry.get("statusCode"),
+                "data": entry
+            })
+    return results
 
 
-# 싱글톤 인스턴스
-solapi_client = SolapiClient()
\ No newline at end of file
+# 싱글톤 인스턴스 (속도 제한과 장애 차단기는 동기/비동기 클라이언트가 공유)
+solapi_rate_limiter = RateLimiter(settings.SOLAPI_REQUESTS_PER_SECOND, settings.SOLAPI_MESSAGES_PER_SECOND)
+solapi_circuit_breaker = CircuitBreaker()
+solapi_client = SolapiClient(solapi_rate_limiter, solapi_circuit_breaker)
+async_solapi_client = AsyncSolapiClient(solapi_rate_limiter, solapi_circuit_breaker)
\ No newline at end of file
@@ -0,0 +1,167 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models import SendHistory, SendStatDaily, Template, Company
+from app.send.retry import SUCCESS_STATUSES
+from config import settings
+
+# (통계 날짜, 템플릿 ID, 발주사 ID) -> [성공 건수, 실패 건수]
+StatKey = Tuple[date, int, int]
+
+# 통계 묶음 기준
+GROUP_BY_DATE = "date"
+GROUP_BY_TEMPLATE = "template"
+GROUP_BY_COMPANY = "company"
+
+# 재집계 시 한 번에 읽는/저장하는 행 수
+REBUILD_CHUNK_SIZE = 10000
+
+
+def stat_date(sent_at: Optional[datetime] = None) -> date:
+    """발송 시각의 통계 날짜 (SEND_SCHEDULE_TIMEZONE 기준, 없으면 현재, 시간대 없는 DB 값은 UTC)"""
+    tz = ZoneInfo(settings.SEND_SCHEDULE_TIMEZONE)
+    if sent_at is None:
+        return datetime.now(tz).date()
+    if sent_at.tzinfo is None:
+        sent_at = sent_at.replace(tzinfo=timezone.utc)
+    return sent_at.astimezone(tz).date()
+
+
+def record_send_stats(db: Session, rows: Iterable[Dict[str, Any]]):
+    """
+    저장하는 발송 이력을 일별 통계에 누적 (커밋은 이력과 함께 호출한 쪽에서)
+
+    (날짜, 템플릿, 발주사)별로 먼저 합친 뒤 INSERT ... ON CONFLICT DO UPDATE 한 번으로 더합니다.
+    """
+    today = stat_date()
+    counts: Dict[StatKey, List[int]] = defaultdict(lambda: [0, 0])
+    for row in rows:
+        counts[(today, row["template_id"], row["company_id"])][0 if row["status"] in SUCCESS_STATUSES else 1] += 1
+    if not counts:
+        return
+
+    # 동시에 저장하는 다른 트랜잭션과 같은 순서로 잠그도록 정렬
+    params = [
+        {"stat_date": key[0], "template_id": key[1], "company_id": key[2], "success_count": s, "fail_count": f}
+        for key, (s, f) in sorted(counts.items())
+    ]
+    db.execute(_upsert_statement(db), params)
+
+
+def _upsert_statement(db: Session):
+    """일별 통계 누적 INSERT (PostgreSQL/SQLite 모두 ON CONFLICT 지원)"""
+    dialect_insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    table = SendStatDaily.__table__
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.stat_date, table.c.template_id, table.c.company_id],
+        set_={
+            "success_count": table.c.success_count + stmt.excluded.success_count,
+            "fail_count": table.c.fail_count + stmt.excluded.fail_count
+        }
+    )
+
+
+def get_send_stats(
+    db: Session,
+    group_by: str = GROUP_BY_DATE,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    template_id: Optional[int] = None,
+    company_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    발송 통계 조회 (일별 통계 테이블에서 집계 - 발송 이력 건수와 무관)
+
+    Args:
+        group_by: date(일별), template(템플릿별), company(발주사별)
+        start_date, end_date: 조회 기간 (양 끝 포함)
+    """
+    success = func.coalesce(func.sum(SendStatDaily.success_count), 0)
+    fail = func.coalesce(func.sum(SendStatDaily.fail_count), 0)
+
+    if group_by == GROUP_BY_TEMPLATE:
+        keys = [SendStatDaily.template_id, Template.title]
+        query = db.query(*keys, success, fail).outerjoin(Template, Template.id == SendStatDaily.template_id)
+    elif group_by == GROUP_BY_COMPANY:
+        keys = [SendStatDaily.company_id, Company.name]
+        query = db.query(*keys, success, fail).outerjoin(Company, Company.id == SendStatDaily.company_id)
+    else:
+        keys = [SendStatDaily.stat_date]
+        query = db.query(*keys, success, fail)
+
+    if start_date:
+        query = query.filter(SendStatDaily.stat_date >= start_date)
+    if end_date:
+        query = query.filter(SendStatDaily.stat_date <= end_date)
+    if template_id is not None:
+        query = query.filter(SendStatDaily.template_id == template_id)
+    if company_id is not None:
+        query = query.filter(SendStatDaily.company_id == company_id)
+
+    items = []
+    for row in query.group_by(*keys).order_by(*keys).all():
+        *key_values, success_count, fail_count = row
+        item = {"success": int(success_count), "fail": int(fail_count)}
+        if group_by == GROUP_BY_TEMPLATE:
+            item["template_id"], item["template_title"] = key_values
+        elif group_by == GROUP_BY_COMPANY:
+            item["company_id"], item["company_name"] = key_values
+        else:
+            item["stat_date"] = key_values[0]
+        items.append(item)
+
+    return {
+        "group_by": group_by,
+        "success": sum(item["success"] for item in items),
+        "fail": sum(item["fail"] for item in items),
+        "items": items
+    }
+
+
+def rebuild_send_stats(db: Session) -> Tuple[int, int]:
+    """
+    DB에 남은 발송 이력으로 일별 통계 재집계 (해당 기간의 기존 통계는 교체)
+
+    보관(archive_send_history)으로 삭제된 달의 통계는 다시 만들 수 없으므로, 남은 이력 중 가장 오래된
+    발송 날짜부터만 교체합니다. 그보다 이전 통계가 있으면 이력이 보관된 것이므로, 일부 이력만 남았을 수 있는
+    가장 오래된 날짜도 기존 통계를 유지합니다 (보관은 UTC 월 단위, 통계 날짜는 SEND_SCHEDULE_TIMEZONE 기준).
+    발송 이력은 REBUILD_CHUNK_SIZE건씩 나눠 읽으므로 메모리는 (날짜, 템플릿, 발주사) 조합 수만큼만 사용합니다.
+
+    Returns:
+        (집계한 발송 이력 건수, 저장한 통계 행 수)
+    """
+    oldest = db.query(func.min(SendHistory.sent_at)).scalar()
+    if oldest is None:
+        return 0, 0
+
+    start = stat_date(oldest)
+    if db.query(SendStatDaily.id).filter(SendStatDaily.stat_date < start).first() is not None:
+        start += timedelta(days=1)
+
+    counts: Dict[StatKey, List[int]] = defaultdict(lambda: [0, 0])
+    history_count = 0
+    query = db.query(
+        SendHistory.template_id, SendHistory.company_id, SendHistory.status, SendHistory.sent_at
+    ).yield_per(REBUILD_CHUNK_SIZE)
+    for template_id, company_id, status, sent_at in query:
+        day = stat_date(sent_at)
+        if day < start:
+            continue
+        counts[(day, template_id, company_id)][0 if status in SUCCESS_STATUSES else 1] += 1
+        history_count += 1
+
+    params = [
+        {"stat_date": key[0], "template_id": key[1], "company_id": key[2], "success_count": s, "fail_count": f}
+        for key, (s, f) in sorted(counts.items())
+    ]
+    db.query(SendStatDaily).filter(SendStatDaily.stat_date >= start).delete(synchronize_session=False)
+    for i in range(0, len(params), REBUILD_CHUNK_SIZE):
+        db.execute(insert(SendStatDaily), params[i:i + REBUILD_CHUNK_SIZE])
+    db.commit()
+    return history_count, len(params)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발송 이력 보관
+
+보존 기간(SEND_HISTORY_RETENTION_DAYS)이 지난 달의 발송 이력을 월별 gzip CSV 파일로 옮기고 DB에서 삭제합니다.
+PostgreSQL 월별 파티션(migrations/partition_send_history.sql)을 쓰는 경우 다음 달 파티션도 미리 만듭니다.
+매달 초 한 번 실행하세요.
+
+Usage:
+    railway run python archive_send_history.py
+    railway run python archive_send_history.py --retention-days 180 --archive-dir /data/archive
+"""
+import argparse
+from app.database import SessionLocal
+from app.send.archive import archive_send_history, ensure_send_history_partitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발송 이력 보관")
+    parser.add_argument("--retention-days", type=int, help="DB에 남길 기간 (기본값: SEND_HISTORY_RETENTION_DAYS)")
+    parser.add_argument("--archive-dir", help="보관 파일 경로 (기본값: SEND_HISTORY_ARCHIVE_DIR)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ensure_send_history_partitions(db)
+        archived = archive_send_history(db, retention_days=args.retention_days, archive_dir=args.archive_dir)
+        total = sum(count for _, count in archived)
+        print(f"보관 완료: 파일 {len(archived)}개, 발송 이력 {total:,}건")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
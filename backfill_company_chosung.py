@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발주사명 초성 채우기
+
+migrations/add_company_search.sql로 name_chosung 컬럼을 추가한 뒤,
+그 전에 등록된 발주사의 초성을 채웁니다 (초성 검색용, 여러 번 실행해도 됨).
+
+Usage:
+    railway run python backfill_company_chosung.py
+"""
+import time
+from app.database import SessionLocal, init_db
+from app.companies.search import backfill_name_chosung
+
+
+def backfill_company_chosung():
+    init_db()
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        count = backfill_name_chosung(db)
+        print(f"발주사 {count:,}건 초성 저장 ({time.perf_counter() - started:.1f}초)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_company_chosung()
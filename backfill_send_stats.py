@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+일별 발송 통계 재집계
+
+DB에 남은 발송 이력으로 send_stats_daily를 다시 만듭니다.
+통계 테이블 도입 전 이력을 채우거나, 통계가 어긋났을 때 실행하세요.
+보관(archive_send_history.py)으로 삭제된 달의 통계는 그대로 유지됩니다.
+(실행 중 저장되는 발송 이력이 누락될 수 있으므로 발송이 없는 시간에 실행)
+
+Usage:
+    railway run python backfill_send_stats.py
+"""
+import time
+from app.database import SessionLocal, init_db
+from app.send.stats import rebuild_send_stats
+
+
+def backfill_send_stats():
+    init_db()
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        history_count, stat_count = rebuild_send_stats(db)
+        print(f"발송 이력 {history_count:,}건 -> 일별 통계 {stat_count:,}행 ({time.perf_counter() - started:.1f}초)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_send_stats()
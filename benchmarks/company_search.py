@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발주사 검색 벤치마크
+
+발주사 N건(기본 100,000건)을 별도 DB에 생성한 뒤, 발송 화면 자동완성 검색어별로
+기존 검색(ILIKE '%검색어%', 정렬 없음)과 새 검색(search_companies - 인덱스 + 관련도 정렬)의 시간을 비교합니다.
+SQLite는 FTS5 trigram 테이블, PostgreSQL은 pg_trgm GIN 인덱스를 만들어 측정합니다.
+
+Usage:
+    python benchmarks/company_search.py
+    python benchmarks/company_search.py --rows 10000
+    python benchmarks/company_search.py --database-url postgresql://user:pw@localhost/bench
+
+주의: --database-url에는 비어 있는 벤치마크 전용 DB만 지정하세요 (테이블을 새로 만듭니다).
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, or_, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import Company  # noqa: E402
+from app.companies.hangul import extract_chosung  # noqa: E402
+from app.companies.search import ensure_company_search_index, search_companies  # noqa: E402
+
+PREFIXES = ["우리", "대한", "한국", "삼성", "현대", "동아", "미래", "서울", "부산", "하나", "신세계", "글로벌", "에이스", "태평양"]
+SUFFIXES = ["상사", "물산", "전자", "건설", "식품", "유통", "무역", "산업", "제약", "테크"]
+INSERT_CHUNK_SIZE = 10000
+RESULT_LIMIT = 20
+
+# (이름, 검색어) - 입력 중인 자동완성 검색어
+SEARCH_TERMS = [
+    ("한글 2글자", "삼성"),
+    ("한글 4글자", "동아제약"),
+    ("아이디 일부", "C0421"),
+    ("영문", "ace"),
+    ("초성 2자", "ㄷㅇ"),
+    ("초성 4자", "ㄷㅇㅈㅇ"),
+    ("결과 없음", "없는발주사"),
+]
+
+# PostgreSQL 검색 인덱스 (migrations/add_company_search.sql과 같음)
+POSTGRESQL_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_companies_name_trgm ON companies USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_companies_company_id_trgm ON companies USING gin (company_id gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_companies_name_chosung_trgm ON companies USING gin (name_chosung gin_trgm_ops)",
+]
+
+
+def seed(engine, rows: int):
+    """발주사 rows건 생성"""
+    rng = random.Random(42)
+    started = time.perf_counter()
+    for offset in range(0, rows, INSERT_CHUNK_SIZE):
+        batch = []
+        for i in range(offset, min(offset + INSERT_CHUNK_SIZE, rows)):
+            name = f"{rng.choice(PREFIXES)}{rng.choice(SUFFIXES)} {i}호점"
+            batch.append({
+                "name": name,
+                "name_chosung": extract_chosung(name),
+                "phone": f"010{i:08d}",
+                "company_id": f"C{i:06d}",
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(Company), batch)
+        print(f"\r  {offset + len(batch):,}/{rows:,}건 생성", end="", flush=True)
+    print(f"\n  생성 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+def create_search_index(engine, db):
+    """검색 인덱스 생성 (SQLite FTS5 / PostgreSQL pg_trgm)"""
+    started = time.perf_counter()
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for statement in POSTGRESQL_INDEXES:
+                conn.execute(text(statement))
+            conn.execute(text("ANALYZE companies"))
+    else:
+        ensure_company_search_index(db)
+    print(f"  생성 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+def legacy_search(db, term: str):
+    """기존 검색 (발주사명/아이디 ILIKE, 정렬 없음)"""
+    return db.query(Company).filter(
+        or_(Company.name.ilike(f"%{term}%"), Company.company_id.ilike(f"%{term}%"))
+    ).limit(RESULT_LIMIT).all()
+
+
+def new_search(db, term: str):
+    """새 검색 (인덱스 + 초성 + 관련도 정렬)"""
+    return search_companies(db, db.query(Company), term, limit=RESULT_LIMIT).limit(RESULT_LIMIT).all()
+
+
+def measure(db, search, term: str, repeat: int):
+    """실행 시간 중앙값(ms)과 결과 건수"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = search(db, term)
+        samples.append((time.perf_counter() - started) * 1000)
+        db.expunge_all()
+    return statistics.median(samples), len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발주사 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="생성할 발주사 건수 (기본값: 100,000)")
+    parser.add_argument("--repeat", type=int, default=7, help="검색어별 반복 횟수 (기본값: 7)")
+    parser.add_argument("--database-url", help="벤치마크 전용 DB URL (기본값: 임시 SQLite 파일)")
+    args = parser.parse_args()
+
+    workdir = None
+    database_url = args.database_url
+    if not database_url:
+        workdir = tempfile.mkdtemp(prefix="company_search_bench_")
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    engine = create_engine(database_url)
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}")
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    print(f"\n1. 발주사 {args.rows:,}건 생성")
+    seed(engine, args.rows)
+
+    db = sessionmaker(bind=engine)()
+    print("\n2. 기존 검색")
+    before = {name: measure(db, legacy_search, term, args.repeat) for name, term in SEARCH_TERMS}
+
+    print("\n3. 검색 인덱스 생성")
+    create_search_index(engine, db)
+    after = {name: measure(db, new_search, term, args.repeat) for name, term in SEARCH_TERMS}
+    db.close()
+
+    print(f"\n결과 (중앙값, {args.repeat}회 반복, 최대 {RESULT_LIMIT}건)")
+    print(f"  {'검색어':<20}{'기존':>14}{'새 검색':>14}")
+    for name, term in SEARCH_TERMS:
+        (old_ms, old_count), (new_ms, new_count) = before[name], after[name]
+        label = f"{name} ({term})"
+        print(f"  {label:<20}{old_ms:>9.2f}ms {old_count:>2}건{new_ms:>9.2f}ms {new_count:>2}건")
+
+    engine.dispose()
+    if workdir:
+        print(f"\n벤치마크 DB: {workdir}")
+
+
+if __name__ == "__main__":
+    main()
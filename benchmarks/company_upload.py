@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발주사 대량 등록 CSV / XLSX 벤치마크
+
+같은 발주사 N행(기본 10,000행)을 XLSX, CSV(UTF-8), CSV(CP949) 파일로 만든 뒤
+파일 읽기만 / 읽기 + 검사 + 저장(create_companies_bulk)의 시간을 각각 비교합니다.
+
+Usage:
+    python benchmarks/company_upload.py
+    python benchmarks/company_upload.py --rows 50000 --repeat 5
+"""
+import argparse
+import csv
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openpyxl  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.companies.service import create_companies_bulk  # noqa: E402
+from app.companies.upload import open_upload_rows  # noqa: E402
+
+HEADERS = ["발주사명*", "전화번호*", "발주사아이디*", "메모"]
+
+
+def make_rows(rows: int):
+    """업로드 행 생성 (발주사명, 전화번호, 발주사아이디, 메모)"""
+    return [[f"벤치마크상사{i}", f"010{i:08d}", f"B{i:06d}", "메모" if i % 3 == 0 else None] for i in range(rows)]
+
+
+def make_files(rows: int):
+    """{파일명: 내용} - 같은 행을 형식별로 저장"""
+    data = make_rows(rows)
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("발주사 등록")
+    ws.append(HEADERS)
+    for row in data:
+        ws.append(row)
+    xlsx = io.BytesIO()
+    wb.save(xlsx)
+
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(HEADERS)
+    writer.writerows(data)
+
+    return {
+        "companies.xlsx": xlsx.getvalue(),
+        "companies.csv": text.getvalue().encode("utf-8"),
+        "companies_cp949.csv": text.getvalue().encode("cp949"),
+    }
+
+
+def measure_parse(filename: str, content: bytes, rows: int, repeat: int) -> float:
+    """파일 읽기만 (행 생성까지) 시간 중앙값(ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = sum(1 for _ in open_upload_rows(io.BytesIO(content), filename, max_rows=rows))
+        samples.append((time.perf_counter() - started) * 1000)
+        assert count == rows, count
+    return statistics.median(samples)
+
+
+def measure_import(filename: str, content: bytes, rows: int, repeat: int, workdir: str) -> float:
+    """읽기 + 검사 + 저장 시간 중앙값(ms) - 매번 빈 SQLite DB에 등록"""
+    samples = []
+    for n in range(repeat):
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, f'{filename}_{n}.db')}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            started = time.perf_counter()
+            success_count, errors = create_companies_bulk(db, open_upload_rows(io.BytesIO(content), filename, max_rows=rows))
+            samples.append((time.perf_counter() - started) * 1000)
+            assert success_count == rows and not errors, (success_count, errors[:3])
+        finally:
+            db.close()
+            engine.dispose()
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발주사 대량 등록 CSV / XLSX 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000, help="업로드 행 수 (기본값: 10,000)")
+    parser.add_argument("--repeat", type=int, default=3, help="형식별 반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    print(f"1. 발주사 {args.rows:,}행 파일 생성")
+    files = make_files(args.rows)
+    for filename, content in files.items():
+        print(f"  {filename:<22}{len(content) / 1024:>10.0f}KB")
+
+    workdir = tempfile.mkdtemp(prefix="company_upload_bench_")
+    print("\n2. 측정")
+    results = {}
+    for filename, content in files.items():
+        parse = measure_parse(filename, content, args.rows, args.repeat)
+        total = measure_import(filename, content, args.rows, args.repeat, workdir)
+        results[filename] = (parse, total)
+        print(f"  {filename} 완료")
+
+    xlsx_parse, xlsx_total = results["companies.xlsx"]
+    print(f"\n결과 (중앙값, {args.repeat}회 반복)")
+    print(f"  {'파일':<22}{'읽기':>12}{'읽기+저장':>14}{'XLSX 대비':>12}")
+    for filename, (parse, total) in results.items():
+        print(f"  {filename:<22}{parse:>10.1f}ms{total:>12.1f}ms{xlsx_total / total:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+send_history 인덱스 벤치마크
+
+발송 이력 N건(기본 1,000,000건)을 별도 DB에 생성한 뒤,
+발송 이력 화면에서 쓰는 조회를 인덱스 없이 / 인덱스 생성 후 각각 실행해 시간을 비교합니다.
+
+Usage:
+    python benchmarks/send_history_indexes.py
+    python benchmarks/send_history_indexes.py --rows 100000
+    python benchmarks/send_history_indexes.py --database-url postgresql://user:pw@localhost/bench
+
+주의: --database-url에는 비어 있는 벤치마크 전용 DB만 지정하세요 (테이블을 새로 만듭니다).
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select, text  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import User, Company, Template, SendHistory  # noqa: E402
+
+# 인덱스 유무를 비교할 조회용 인덱스
+QUERY_INDEXES = (
+    "ix_send_history_sent_at",
+    "ix_send_history_company_sent_at",
+    "ix_send_history_campaign_name",
+    "ix_send_history_status",
+)
+
+COMPANY_COUNT = 1000
+CAMPAIGN_COUNT = 500
+STATUSES = ["성공"] * 90 + ["재발송성공"] * 5 + ["실패"] * 3 + ["재발송실패"] * 2
+INSERT_CHUNK_SIZE = 10000
+
+
+def seed(engine, rows: int):
+    """기준 데이터와 발송 이력 rows건 생성"""
+    now = datetime.now(timezone.utc)
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "username": "bench", "password": "-", "name": "bench"}])
+        conn.execute(insert(Template), [{"id": 1, "category": "검수완료", "title": "bench", "content": "{발주사명} {캠페인명}"}])
+        conn.execute(insert(Company), [
+            {"id": i, "name": f"발주사{i}", "phone": f"010{i:08d}", "company_id": f"C{i:05d}"}
+            for i in range(1, COMPANY_COUNT + 1)
+        ])
+
+    started = time.perf_counter()
+    for offset in range(0, rows, INSERT_CHUNK_SIZE):
+        batch = []
+        for _ in range(min(INSERT_CHUNK_SIZE, rows - offset)):
+            company_id = rng.randint(1, COMPANY_COUNT)
+            campaign_name = f"캠페인{rng.randint(1, CAMPAIGN_COUNT)}"
+            batch.append({
+                "user_id": 1,
+                "template_id": 1,
+                "company_id": company_id,
+                "campaign_name": campaign_name,
+                "message_content": f"발주사{company_id} 님 {campaign_name} 검수가 완료되었습니다.",
+                "status": rng.choice(STATUSES),
+                "solapi_message_id": None,
+                "sent_at": now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(SendHistory), batch)
+        print(f"\r  {offset + len(batch):,}/{rows:,}건 생성", end="", flush=True)
+    print(f"\n  생성 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+def benchmark_queries():
+    """(이름, 조회) 목록 - 발송 이력 화면의 최신순 100건 조회"""
+    newest = SendHistory.sent_at.desc()
+    return [
+        ("최신순", select(SendHistory).order_by(newest).limit(100)),
+        ("발주사별 최신순", select(SendHistory).where(SendHistory.company_id == 42).order_by(newest).limit(100)),
+        ("캠페인별", select(SendHistory).where(SendHistory.campaign_name == "캠페인7").order_by(newest).limit(100)),
+        ("실패 건", select(SendHistory).where(SendHistory.status == "재발송실패").order_by(newest).limit(100)),
+    ]
+
+
+def measure(engine, repeat: int):
+    """조회별 실행 시간 중앙값(ms)"""
+    timings = {}
+    with engine.connect() as conn:
+        for name, query in benchmark_queries():
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(query).fetchall()
+                samples.append((time.perf_counter() - started) * 1000)
+            timings[name] = statistics.median(samples)
+    return timings
+
+
+def print_plans(engine):
+    """조회별 실행 계획 출력"""
+    explain = "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    with engine.connect() as conn:
+        for name, query in benchmark_queries():
+            sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+            plan = conn.execute(text(f"{explain} {sql}")).fetchall()
+            print(f"  [{name}] " + " / ".join(str(row[-1]) for row in plan))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="send_history 인덱스 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="생성할 발송 이력 건수 (기본값: 1,000,000)")
+    parser.add_argument("--repeat", type=int, default=5, help="조회별 반복 횟수 (기본값: 5)")
+    parser.add_argument("--database-url", help="벤치마크 전용 DB URL (기본값: 임시 SQLite 파일)")
+    args = parser.parse_args()
+
+    workdir = None
+    database_url = args.database_url
+    if not database_url:
+        workdir = tempfile.mkdtemp(prefix="send_history_bench_")
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    engine = create_engine(database_url)
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}")
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    indexes = [index for index in SendHistory.__table__.indexes if index.name in QUERY_INDEXES]
+    for index in indexes:
+        index.drop(engine)
+
+    print(f"\n1. 발송 이력 {args.rows:,}건 생성")
+    seed(engine, args.rows)
+
+    print("\n2. 인덱스 없이 조회")
+    print_plans(engine)
+    before = measure(engine, args.repeat)
+
+    print("\n3. 인덱스 생성")
+    started = time.perf_counter()
+    for index in indexes:
+        index.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    print(f"  생성 완료 ({time.perf_counter() - started:.1f}초)")
+    print_plans(engine)
+    after = measure(engine, args.repeat)
+
+    print(f"\n결과 (중앙값, {args.repeat}회 반복)")
+    print(f"  {'조회':<16}{'인덱스 없음':>14}{'인덱스 사용':>14}{'배율':>10}")
+    for name in before:
+        ratio = before[name] / after[name] if after[name] else float("inf")
+        print(f"  {name:<16}{before[name]:>12.2f}ms{after[name]:>12.2f}ms{ratio:>9.1f}x")
+
+    engine.dispose()
+    if workdir:
+        print(f"\n벤치마크 DB: {workdir}")
+
+
+if __name__ == "__main__":
+    main()
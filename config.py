@@ -8,6 +8,24 @@ class Settings(BaseSettings):
     SOLAPI_API_KEY: str = ""
     SOLAPI_API_SECRET: str = ""
     SOLAPI_SENDER_PHONE: str = ""
+    # 다건 발송(send-many) 1회 요청당 메시지 수 (SOLAPI 최대 10,000건)
+    SOLAPI_BATCH_SIZE: int = 1000
+    # 진행 상황을 전달하는 발송(스트리밍/백그라운드 작업)의 1회 요청당 메시지 수
+    # (작을수록 진행 상황이 자주 갱신되지만 요청 수가 늘어남, 0 이하: SOLAPI_BATCH_SIZE 사용)
+    SEND_PROGRESS_CHUNK_SIZE: int = 100
+    # HTTP 연결 풀 크기 (미설정 시 SEND_CONCURRENCY와 동일)
+    SOLAPI_POOL_SIZE: Optional[int] = None
+    # 연결/응답 타임아웃 (초)
+    SOLAPI_CONNECT_TIMEOUT: float = 5
+    SOLAPI_READ_TIMEOUT: float = 30
+    # 계정 단위 발송 속도 제한 (0 이하: 제한 없음)
+    SOLAPI_REQUESTS_PER_SECOND: float = 10
+    SOLAPI_MESSAGES_PER_SECOND: float = 0
+    # 장애 차단기 (연속 장애 횟수 / 최근 window건 중 장애 비율로 차단, reset_timeout초 후 복구 확인)
+    SOLAPI_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    SOLAPI_CIRCUIT_FAILURE_RATE: float = 0.5
+    SOLAPI_CIRCUIT_WINDOW: int = 20
+    SOLAPI_CIRCUIT_RESET_TIMEOUT: float = 30
 
     # 데이터베이스 (로컬: SQLite, Vercel: PostgreSQL)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./database.db")
@@ -19,6 +37,33 @@ class Settings(BaseSettings):
     # 템플릿 제한
     MAX_TEMPLATES: int = 10
 
+    # 일괄 발송 동시 처리 수 (DB 연결 풀 크기 10 이하로 유지)
+    SEND_CONCURRENCY: int = 5
+    # 백그라운드 발송 작업 동시 실행 수
+    SEND_JOB_WORKERS: int = 1
+    # 발송 재시도 정책 (최대 시도 횟수, 지수 백오프 기준/상한 초, jitter, 재시도 대상 오류)
+    # 다건 발송의 timeout/network는 연결 단계 실패만 해당 (요청 후 응답 없음은 중복 발송 방지를 위해 재시도하지 않음)
+    SEND_RETRY_MAX_ATTEMPTS: int = 3
+    SEND_RETRY_BACKOFF_BASE: float = 0.5
+    SEND_RETRY_BACKOFF_CAP: float = 10
+    SEND_RETRY_JITTER: bool = True
+    SEND_RETRY_ON: str = "timeout,network,rate_limited,server_error"
+    # 재시도 전 최대 대기 초 (Retry-After가 이보다 길면 재시도하지 않고 실패 처리)
+    SEND_RETRY_MAX_WAIT: float = 30
+    # 발송 이력 일괄 저장 주기 (N건마다 또는 T밀리초마다)
+    HISTORY_FLUSH_SIZE: int = 200
+    HISTORY_FLUSH_INTERVAL_MS: int = 500
+    # 예약 발송 (시간대 없는 시각과 일별 통계 날짜의 기준 시간대, 다른 프로세스의 예약을 확인하는 최대 대기 초)
+    SEND_SCHEDULE_TIMEZONE: str = "Asia/Seoul"
+    SEND_SCHEDULER_MAX_SLEEP: float = 60
+    # 발송 이력 보관 (기간 없이 조회할 때의 최근 조회 일수, 보존 일수 - 지난 달은 압축 파일로 보관 후 삭제, 보관 경로)
+    SEND_HISTORY_HOT_DAYS: int = 90
+    SEND_HISTORY_RETENTION_DAYS: int = 365
+    SEND_HISTORY_ARCHIVE_DIR: str = "archive"
+    # 발주사 엑셀 대량 등록 (최대 데이터 행 수, 최대 파일 크기 바이트)
+    COMPANY_UPLOAD_MAX_ROWS: int = 10000
+    COMPANY_UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024
+
     class Config:
         env_file = ".env"
         case_sensitive = True
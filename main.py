@@ -3,12 +3,15 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from starlette.middleware.sessions import SessionMiddleware
 from config import settings
-from app.database import init_db
+from app.database import init_db, SessionLocal
 from app.auth.router import router as auth_router
 from app.companies.router import router as companies_router
 from app.templates.router import router as templates_router
 from app.send.router import router as send_router
 from app.draft.router import router as draft_router
+from app.send.solapi import solapi_client, async_solapi_client, solapi_rate_limiter, solapi_circuit_breaker
+from app.send.jobs import send_job_worker, send_job_scheduler
+from app.companies.search import ensure_company_search_index
 import os
 
 app = FastAPI(title="SOLAPI 문자 발송 시스템")
@@ -68,6 +71,37 @@ def init_database_with_retry(max_retries=5):
 init_database_with_retry()
 
 
+@app.on_event("startup")
+def create_company_search_index():
+    """발주사 검색 인덱스 생성 (SQLite FTS5, PostgreSQL은 마이그레이션 사용)"""
+    db = SessionLocal()
+    try:
+        ensure_company_search_index(db)
+    except Exception as e:
+        print(f"⚠️ 발주사 검색 인덱스 생성 실패: {e}")
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def start_send_job_worker():
+    """발송 작업 워커 및 예약 발송 스케줄러 시작 (미완료 작업 재개, 발송 이력 월별 파티션 생성)"""
+    try:
+        send_job_worker.start()
+        send_job_scheduler.start()
+    except Exception as e:
+        print(f"⚠️ 발송 작업 워커 시작 실패: {e}")
+
+
+@app.on_event("shutdown")
+async def close_solapi_client():
+    """예약 발송 스케줄러, 발송 작업 워커 및 SOLAPI HTTP 세션 종료"""
+    send_job_scheduler.shutdown()
+    send_job_worker.shutdown()
+    solapi_client.close()
+    await async_solapi_client.aclose()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """메인 페이지"""
@@ -113,8 +147,14 @@ async def read_root():
 
 @app.get("/health")
 async def health_check():
-    """헬스체크"""
-    return {"status": "ok"}
+    """헬스체크 (SOLAPI 장애 차단기 상태, 속도 제한 대기 통계 포함)"""
+    return {
+        "status": "ok",
+        "solapi": {
+            "circuit": solapi_circuit_breaker.stats(),
+            "rate_limit": solapi_rate_limiter.stats()
+        }
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+-- Migration: Add indexes to companies
+-- Purpose: company_id is the external key used by bulk upload upserts (ON CONFLICT needs a unique index),
+--          name and phone are looked up by the bulk upload duplicate check
+-- Date: 2026-10-18
+-- Note: Fails without changes if company_id already has duplicates - the query in the error
+--       message lists them. On a large live table, use CREATE INDEX CONCURRENTLY outside a transaction.
+
+BEGIN;
+
+DO $$
+DECLARE
+    duplicate_count INTEGER;
+BEGIN
+    SELECT count(*) INTO duplicate_count
+    FROM (SELECT company_id FROM companies GROUP BY company_id HAVING count(*) > 1) AS duplicates;
+
+    IF duplicate_count > 0 THEN
+        RAISE EXCEPTION '% company_id values are duplicated - check with: SELECT company_id, count(*) FROM companies GROUP BY company_id HAVING count(*) > 1', duplicate_count;
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_companies_company_id
+    ON companies (company_id);
+
+CREATE INDEX IF NOT EXISTS ix_companies_name
+    ON companies (name);
+
+CREATE INDEX IF NOT EXISTS ix_companies_phone
+    ON companies (phone);
+
+ANALYZE companies;
+
+COMMIT;
@@ -0,0 +1,39 @@
+-- Migration: Company search indexes (pg_trgm) and initial-consonant column
+-- Purpose: Company search uses ILIKE '%q%' on name/company_id, which B-tree indexes cannot serve;
+--          pg_trgm GIN indexes can. name_chosung holds the name's initial consonants for 초성 search.
+--          The B-tree index on name_chosung serves prefix candidate lookups (name and company_id
+--          already have B-tree indexes from add_company_indexes.sql).
+-- Date: 2026-10-18
+-- Note: Run backfill_company_chosung.py afterwards to fill name_chosung for existing companies.
+--       CREATE EXTENSION needs a role allowed to create extensions; if step 2 fails, search still
+--       works without it (sequential scan). On a large live table, use CREATE INDEX CONCURRENTLY
+--       outside a transaction.
+
+-- Step 1: Initial-consonant column
+BEGIN;
+
+ALTER TABLE companies
+ADD COLUMN IF NOT EXISTS name_chosung VARCHAR(100);
+
+CREATE INDEX IF NOT EXISTS ix_companies_name_chosung
+    ON companies (name_chosung);
+
+COMMIT;
+
+-- Step 2: Trigram indexes
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_companies_name_trgm
+    ON companies USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_companies_company_id_trgm
+    ON companies USING gin (company_id gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_companies_name_chosung_trgm
+    ON companies USING gin (name_chosung gin_trgm_ops);
+
+ANALYZE companies;
+
+COMMIT;
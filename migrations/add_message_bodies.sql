@@ -0,0 +1,27 @@
+-- Migration: Store send_history message text by reference
+-- Purpose: Bulk sends share one message_bodies row (template text + additional message)
+--          and each history row keeps only body_id and the company name it was sent with
+-- Date: 2026-10-18
+-- Note: Existing rows keep their full message_content; only new bulk sends use body_id.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS message_bodies (
+    id SERIAL PRIMARY KEY,
+    content_hash VARCHAR(64) NOT NULL UNIQUE,
+    template_content TEXT NOT NULL,
+    category VARCHAR(50),
+    additional_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+ALTER TABLE send_history
+ADD COLUMN IF NOT EXISTS body_id INTEGER REFERENCES message_bodies(id) ON DELETE RESTRICT;
+
+ALTER TABLE send_history
+ADD COLUMN IF NOT EXISTS company_name VARCHAR(100);
+
+ALTER TABLE send_history
+ALTER COLUMN message_content DROP NOT NULL;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Migration: Add batch_id (idempotency key) to send_history and send_jobs
+-- Purpose: Replayed bulk send requests return stored results instead of re-sending
+-- Date: 2026-10-18
+
+BEGIN;
+
+-- Step 1: send_history.batch_id + dedupe lookup index
+ALTER TABLE send_history
+ADD COLUMN IF NOT EXISTS batch_id VARCHAR(64);
+
+CREATE INDEX IF NOT EXISTS ix_send_history_batch
+    ON send_history (batch_id, template_id, company_id, campaign_name);
+
+-- Step 2: send_jobs.batch_id (one job per idempotency key)
+ALTER TABLE send_jobs
+ADD COLUMN IF NOT EXISTS batch_id VARCHAR(64);
+
+CREATE UNIQUE INDEX IF NOT EXISTS send_jobs_batch_id_key
+    ON send_jobs (batch_id);
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- Migration: Add indexes for send_history queries
+-- Purpose: History page sorts by sent_at and filters by company, campaign and status
+-- Date: 2026-10-18
+-- Note: On a large live table, run each statement with CREATE INDEX CONCURRENTLY
+--       (outside a transaction) to avoid blocking writes while the index builds.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_send_history_sent_at
+    ON send_history (sent_at);
+
+CREATE INDEX IF NOT EXISTS ix_send_history_company_sent_at
+    ON send_history (company_id, sent_at);
+
+CREATE INDEX IF NOT EXISTS ix_send_history_campaign_name
+    ON send_history (campaign_name);
+
+CREATE INDEX IF NOT EXISTS ix_send_history_status
+    ON send_history (status);
+
+ANALYZE send_history;
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Migration: Add scheduled send time to send_jobs
+-- Purpose: Store scheduled bulk sends and let the scheduler find the next due job by index
+-- Date: 2026-10-18
+
+BEGIN;
+
+ALTER TABLE send_jobs
+ADD COLUMN IF NOT EXISTS send_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX IF NOT EXISTS ix_send_jobs_status_send_at
+    ON send_jobs (status, send_at);
+
+COMMIT;
@@ -0,0 +1,124 @@
+-- Migration: Partition send_history by month (PostgreSQL 12+)
+-- Purpose: Old months are archived and dropped as whole partitions (archive_send_history.py),
+--          and history queries with a date range only scan the matching partitions
+-- Date: 2026-10-18
+-- Note: Copies every row into the new table - run during a maintenance window.
+--       Run add_send_history_batch_id.sql, add_send_history_indexes.sql and add_message_bodies.sql first.
+--       Partition bounds are UTC month boundaries.
+
+BEGIN;
+
+SET LOCAL lock_timeout = '10s';
+
+-- Step 1: Move the current table aside (index names are schema-wide, so free them)
+ALTER TABLE send_history RENAME TO send_history_unpartitioned;
+ALTER INDEX send_history_pkey RENAME TO send_history_unpartitioned_pkey;
+DROP INDEX IF EXISTS ix_send_history_sent_at;
+DROP INDEX IF EXISTS ix_send_history_company_sent_at;
+DROP INDEX IF EXISTS ix_send_history_campaign_name;
+DROP INDEX IF EXISTS ix_send_history_status;
+DROP INDEX IF EXISTS ix_send_history_batch;
+
+-- Step 2: Partitioned table (the partition key must be part of the primary key)
+CREATE TABLE send_history (
+    id INTEGER NOT NULL DEFAULT nextval('send_history_id_seq'),
+    user_id INTEGER NOT NULL,
+    template_id INTEGER NOT NULL,
+    company_id INTEGER NOT NULL,
+    campaign_name VARCHAR(200) NOT NULL,
+    message_content TEXT,
+    body_id INTEGER,
+    company_name VARCHAR(100),
+    status VARCHAR(20) NOT NULL,
+    solapi_message_id VARCHAR(100),
+    batch_id VARCHAR(64),
+    sent_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    CONSTRAINT send_history_pkey PRIMARY KEY (id, sent_at),
+    CONSTRAINT chk_status CHECK (status IN ('성공', '실패', '재발송성공', '재발송실패')),
+    CONSTRAINT send_history_user_id_fkey
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE RESTRICT,
+    CONSTRAINT send_history_template_id_fkey
+        FOREIGN KEY (template_id) REFERENCES templates(id) ON DELETE RESTRICT,
+    CONSTRAINT send_history_company_id_fkey
+        FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
+    CONSTRAINT send_history_body_id_fkey
+        FOREIGN KEY (body_id) REFERENCES message_bodies(id) ON DELETE RESTRICT
+) PARTITION BY RANGE (sent_at);
+
+CREATE INDEX ix_send_history_sent_at ON send_history (sent_at);
+CREATE INDEX ix_send_history_company_sent_at ON send_history (company_id, sent_at);
+CREATE INDEX ix_send_history_campaign_name ON send_history (campaign_name);
+CREATE INDEX ix_send_history_status ON send_history (status);
+CREATE INDEX ix_send_history_batch ON send_history (batch_id, template_id, company_id, campaign_name);
+
+-- Step 3: Monthly partition function (also called by the app to create upcoming months)
+-- Rows of the month already in the default partition would block CREATE ... PARTITION OF,
+-- so the default partition is detached, the month's rows are moved into the new partition,
+-- and the default partition is attached again.
+CREATE OR REPLACE FUNCTION create_send_history_partition(month_start DATE)
+RETURNS VOID AS $$
+DECLARE
+    start_at TIMESTAMP := date_trunc('month', month_start::timestamp);
+    partition_name TEXT := 'send_history_p' || to_char(start_at, 'YYYYMM');
+    lower_bound TIMESTAMPTZ := start_at AT TIME ZONE 'UTC';
+    upper_bound TIMESTAMPTZ := (start_at + INTERVAL '1 month') AT TIME ZONE 'UTC';
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    IF to_regclass('send_history_default') IS NOT NULL AND EXISTS (
+        SELECT 1 FROM send_history_default WHERE sent_at >= lower_bound AND sent_at < upper_bound
+    ) THEN
+        ALTER TABLE send_history DETACH PARTITION send_history_default;
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF send_history FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower_bound, upper_bound
+        );
+        INSERT INTO send_history
+        SELECT * FROM send_history_default WHERE sent_at >= lower_bound AND sent_at < upper_bound;
+        DELETE FROM send_history_default WHERE sent_at >= lower_bound AND sent_at < upper_bound;
+        ALTER TABLE send_history ATTACH PARTITION send_history_default DEFAULT;
+    ELSE
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF send_history FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower_bound, upper_bound
+        );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Step 4: Monthly partitions from the oldest row to two months ahead
+DO $$
+DECLARE
+    month_start DATE;
+BEGIN
+    SELECT date_trunc('month', COALESCE(min(sent_at), now()) AT TIME ZONE 'UTC')::date
+    INTO month_start
+    FROM send_history_unpartitioned;
+
+    WHILE month_start <= (date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '2 months')::date LOOP
+        PERFORM create_send_history_partition(month_start);
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+
+-- Step 5: Default partition (rows outside every monthly partition land here instead of failing)
+CREATE TABLE IF NOT EXISTS send_history_default PARTITION OF send_history DEFAULT;
+
+-- Step 6: Copy rows and hand the id sequence to the new table
+INSERT INTO send_history (
+    id, user_id, template_id, company_id, campaign_name, message_content, body_id, company_name,
+    status, solapi_message_id, batch_id, sent_at
+)
+SELECT
+    id, user_id, template_id, company_id, campaign_name, message_content, body_id, company_name,
+    status, solapi_message_id, batch_id, COALESCE(sent_at, now())
+FROM send_history_unpartitioned;
+
+ALTER SEQUENCE send_history_id_seq OWNED BY send_history.id;
+DROP TABLE send_history_unpartitioned;
+
+ANALYZE send_history;
+
+COMMIT;
@@ -2,13 +2,20 @@
 """
 Database Migration Script
 Executes SQL migration to change foreign key constraint to CASCADE
+
+Usage:
+    railway run python run_migration.py                                  # migrations/migrate_cascade.sql
+    railway run python run_migration.py migrations/<migration_file>.sql
 """
 import os
 import sys
 import psycopg2
 from psycopg2 import sql
 
-def run_migration():
+DEFAULT_MIGRATION_FILE = "migrations/migrate_cascade.sql"
+
+
+def run_migration(migration_file: str = DEFAULT_MIGRATION_FILE):
     """Execute SQL migration script"""
     # Get database URL from environment
     database_url = os.getenv("DATABASE_URL")
@@ -19,7 +26,6 @@ def run_migration():
         sys.exit(1)
 
     # Read SQL migration file
-    migration_file = "migrations/migrate_cascade.sql"
     try:
         with open(migration_file, "r", encoding="utf-8") as f:
             sql_script = f.read()
@@ -43,6 +49,12 @@ def run_migration():
         cursor.execute(sql_script)
 
         print("\n✅ Migration completed successfully!")
+
+        if os.path.normpath(migration_file) != os.path.normpath(DEFAULT_MIGRATION_FILE):
+            cursor.close()
+            conn.close()
+            return
+
         print("\n📊 Verification:")
         print("=" * 60)
 
@@ -95,4 +107,4 @@ if __name__ == "__main__":
     print("=" * 60)
     print("🔧 Database Migration Tool")
     print("=" * 60)
-    run_migration()
+    run_migration(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MIGRATION_FILE)
@@ -86,16 +86,23 @@ async function loadCompaniesPage() {
                         <div class="alert alert-info">
                             <strong>업로드 방법:</strong><br>
                             1. "엑셀 템플릿 다운로드" 버튼을 클릭하여 템플릿을 다운로드합니다<br>
-                            2. 템플릿에 발주사 정보를 입력합니다 (최대 500개)<br>
-                            3. 작성한 파일을 업로드합니다<br><br>
+                            2. 템플릿에 발주사 정보를 입력합니다 (최대 10,000개)<br>
+                            3. 작성한 파일을 업로드합니다 (CSV/TSV도 같은 컬럼 순서로 업로드 가능)<br><br>
                             <strong>필수 항목:</strong> 발주사명, 전화번호, 발주사아이디<br>
                             <strong>전화번호 형식:</strong> 01012345678 (하이픈 없이)
                         </div>
 
                         <div class="mb-3">
-                            <label class="form-label">엑셀 파일 선택</label>
-                            <input type="file" class="form-control" id="excel-file" accept=".xlsx,.xls">
-                            <div class="form-text">최대 파일 크기: 5MB, 최대 행 수: 500개</div>
+                            <label class="form-label">엑셀/CSV 파일 선택</label>
+                            <input type="file" class="form-control" id="excel-file" accept=".xlsx,.xls,.csv,.tsv">
+                            <div class="form-text">최대 파일 크기: 20MB, 최대 행 수: 10,000개</div>
+                        </div>
+
+                        <div class="form-check mb-3">
+                            <input class="form-check-input" type="checkbox" id="upload-upsert">
+                            <label class="form-check-label" for="upload-upsert">
+                                이미 등록된 발주사 아이디는 발주사명/전화번호/메모 수정
+                            </label>
                         </div>
 
                         <div id="upload-progress" style="display: none;">
@@ -320,14 +327,14 @@ async function uploadExcelFile() {
     }
 
     // 파일 확장자 체크
-    if (!file.name.endsWith('.xlsx') && !file.name.endsWith('.xls')) {
-        alert('엑셀 파일만 업로드 가능합니다 (.xlsx, .xls)');
+    if (!/\.(xlsx|xls|csv|tsv)$/i.test(file.name)) {
+        alert('엑셀 또는 CSV 파일만 업로드 가능합니다 (.xlsx, .xls, .csv, .tsv)');
         return;
     }
 
-    // 파일 크기 체크 (5MB)
-    if (file.size > 5 * 1024 * 1024) {
-        alert('파일 크기는 5MB를 초과할 수 없습니다.');
+    // 파일 크기 체크 (20MB)
+    if (file.size > 20 * 1024 * 1024) {
+        alert('파일 크기는 20MB를 초과할 수 없습니다.');
         return;
     }
 
@@ -341,7 +348,8 @@ async function uploadExcelFile() {
     document.getElementById('upload-btn').disabled = true;
 
     try {
-        const response = await fetch('/api/companies/bulk-upload', {
+        const upsert = document.getElementById('upload-upsert').checked;
+        const response = await fetch(`/api/companies/bulk-upload?upsert=${upsert}`, {
             method: 'POST',
             credentials: 'include',
             body: formData
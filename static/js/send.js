@@ -70,7 +70,7 @@ async function loadSendPage() {
                     <div class="row g-3">
                         <div class="col-md-5">
                             <label class="form-label">발주사</label>
-                            <input type="text" class="form-control" id="company-search-input" placeholder="발주사명 또는 아이디 검색..." oninput="searchCompaniesForSend()">
+                            <input type="text" class="form-control" id="company-search-input" placeholder="발주사명, 아이디 또는 초성(ㅇㄹㅅㅅ) 검색..." oninput="searchCompaniesForSend()">
                             <div id="company-search-results" class="list-group mt-2" style="max-height: 200px; overflow-y: auto; display: none;"></div>
                             <input type="hidden" id="selected-company-id">
                             <input type="text" class="form-control mt-2" id="selected-company-name" placeholder="선택된 발주사" readonly>
@@ -106,7 +106,9 @@ async function loadSendPage() {
         </div>
 
         <!-- 발송 버튼 -->
-        <div class="text-end">
+        <div class="d-flex justify-content-end align-items-center gap-2">
+            <label class="form-label mb-0 small text-muted" for="send-at">예약 발송 (선택사항)</label>
+            <input type="datetime-local" class="form-control w-auto" id="send-at">
             <button class="btn btn-success btn-lg" onclick="sendBulkMessages()" id="send-btn" disabled>
                 📱 일괄 발송
             </button>
@@ -227,19 +229,40 @@ function updateCampaignNameField() {
     }
 }
 
-async function searchCompaniesForSend() {
-    const input = document.getElementById('company-search-input');
-    const resultsDiv = document.getElementById('company-search-results');
-    const query = input.value.trim();
+// 발주사 검색 입력 후 검색 요청까지 기다리는 시간 (입력할 때마다 요청하지 않도록)
+const COMPANY_SEARCH_DEBOUNCE_MS = 250;
+// 자동완성에 표시할 최대 건수
+const COMPANY_SEARCH_LIMIT = 20;
+let companySearchTimer = null;
+let companySearchSeq = 0;
+
+function searchCompaniesForSend() {
+    const query = document.getElementById('company-search-input').value.trim();
 
+    clearTimeout(companySearchTimer);
     if (!query) {
-        resultsDiv.style.display = 'none';
+        companySearchSeq++;  // 진행 중인 검색 결과 무시
+        document.getElementById('company-search-results').style.display = 'none';
         return;
     }
 
+    companySearchTimer = setTimeout(() => runCompanySearchForSend(query), COMPANY_SEARCH_DEBOUNCE_MS);
+}
+
+async function runCompanySearchForSend(query) {
+    const resultsDiv = document.getElementById('company-search-results');
+    const seq = ++companySearchSeq;
+
     try {
-        // 백엔드 API를 통해 검색 (발주사명 또는 아이디로 검색)
-        const searchResults = await apiCall(`/api/companies?search=${encodeURIComponent(query)}`);
+        // 백엔드 API를 통해 검색 (발주사명, 아이디 또는 초성으로 검색 - 관련도 순)
+        const searchResults = await apiCall(
+            `/api/companies?search=${encodeURIComponent(query)}&limit=${COMPANY_SEARCH_LIMIT}`
+        );
+
+        // 더 늦게 입력한 검색어의 요청이 있으면 이 결과는 버림
+        if (seq !== companySearchSeq) {
+            return;
+        }
 
         if (searchResults.length === 0) {
             resultsDiv.innerHTML = '<div class="list-group-item">검색 결과가 없습니다</div>';
@@ -254,6 +277,9 @@ async function searchCompaniesForSend() {
         `).join('');
         resultsDiv.style.display = 'block';
     } catch (error) {
+        if (seq !== companySearchSeq) {
+            return;
+        }
         console.error('발주사 검색 실패:', error);
         resultsDiv.innerHTML = '<div class="list-group-item text-danger">검색 중 오류가 발생했습니다</div>';
         resultsDiv.style.display = 'block';
@@ -383,7 +409,18 @@ async function sendBulkMessages() {
         return;
     }
 
-    if (!confirm(`${sendList.length}건의 문자를 발송하시겠습니까?`)) {
+    // 예약 발송 시각 (비어 있으면 바로 발송)
+    const sendAtValue = document.getElementById('send-at').value;
+    const sendAt = sendAtValue ? new Date(sendAtValue) : null;
+    if (sendAt && sendAt <= new Date()) {
+        alert('예약 시각은 현재 시각 이후여야 합니다.');
+        return;
+    }
+
+    const confirmMessage = sendAt
+        ? `${sendList.length}건의 문자를 ${sendAt.toLocaleString()}에 예약 발송하시겠습니까?`
+        : `${sendList.length}건의 문자를 발송하시겠습니까?`;
+    if (!confirm(confirmMessage)) {
         return;
     }
 
@@ -405,18 +442,36 @@ async function sendBulkMessages() {
                 </div>
                 <div>
                     <strong>${sendList.length}건 발송 중...</strong>
-                    <div class="small">대량 발송은 최대 5분 정도 소요될 수 있습니다.</div>
+                    <div class="small" id="send-progress-detail">발송 작업을 등록하고 있습니다.</div>
                 </div>
             </div>
         `;
         sendBtn.parentElement.appendChild(progressDiv);
 
-        const result = await apiCall('/api/send/bulk', 'POST', {
+        // 발송 작업 등록 후 완료될 때까지 진행 상황 조회
+        // (멱등성 키: 등록 요청이 재전송되어도 같은 작업으로 처리되어 중복 발송되지 않음)
+        const job = await apiCall('/api/send/jobs', 'POST', {
             template_id: parseInt(templateId),
             items: sendList,
-            additional_message: additionalMessage
+            additional_message: additionalMessage,
+            idempotency_key: createIdempotencyKey(),
+            send_at: sendAt ? sendAt.toISOString() : null
         });
 
+        if (sendAt) {
+            progressDiv.remove();
+            alert(`예약 완료!\n\n${sendAt.toLocaleString()}에 ${job.total}건이 발송됩니다.\n(작업 번호: ${job.job_id})`);
+
+            // 발송 목록 초기화
+            sendList = [];
+            renderSendList();
+            updateSendButton();
+            document.getElementById('send-at').value = '';
+            return;
+        }
+
+        const result = await waitForSendJob(job.job_id);
+
         // 진행 상황 표시 제거
         if (progressDiv.parentElement) {
             progressDiv.remove();
@@ -456,6 +511,40 @@ async function sendBulkMessages() {
     }
 }
 
+// 일괄 발송 멱등성 키 생성
+function createIdempotencyKey() {
+    if (window.crypto && crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return Date.now().toString(36) + '-' + Math.random().toString(36).slice(2);
+}
+
+// 발송 작업 진행 상황 조회 (완료/실패 시 결과 반환)
+async function waitForSendJob(jobId) {
+    while (true) {
+        const job = await apiCall(`/api/send/jobs/${jobId}`);
+
+        const detail = document.getElementById('send-progress-detail');
+        if (detail) {
+            detail.textContent = `${job.processed}/${job.total}건 처리 (성공 ${job.success}건, 실패 ${job.fail}건)`;
+        }
+
+        if (job.status === '완료') {
+            return {
+                total: job.total,
+                success: job.success,
+                fail: job.fail,
+                results: job.results.filter(r => r !== null)
+            };
+        }
+        if (job.status === '실패') {
+            throw new Error(job.error || '발송 작업 처리 중 오류가 발생했습니다');
+        }
+
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+}
+
 async function saveDraft() {
     const templateId = document.getElementById('send-template').value;
 